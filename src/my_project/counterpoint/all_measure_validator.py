@@ -15,7 +15,7 @@ def validate_part_total_range(global_ctx: GlobalContext) -> bool:
     all_pitches = [
         an.note.pitch for m in global_ctx.completed_measures for an in m.annotated_notes if an.note.pitch is not None
     ]
-    p_min = min(all_pitches, key=lambda p: p.num())
-    p_max = max(all_pitches, key=lambda p: p.num())
+    p_min = min(all_pitches, key=lambda p: p.num().value)
+    p_max = max(all_pitches, key=lambda p: p.num().value)
 
     return (p_max - p_min).step() <= IntervalStep.idx_1(11)
@@ -1,14 +1,18 @@
-from dataclasses import dataclass, replace
+from dataclasses import dataclass, field, replace
 
 from my_project.counterpoint.local_measure_context import LocalMeasureContext
 from my_project.counterpoint.model import (
     AnnotatedMeasure,
+    AnnotatedNote,
     RythmnType,
 )
 from my_project.model import (
     Pitch,
 )
 
+# 小節の探索結果を使い回すためのキー。 (完了済みの小節数, 直前の小節の音符, 次の小節の冒頭のマーク)
+LocalSearchKey = tuple[int, tuple[AnnotatedNote, ...] | None, Pitch | None]
+
 # ------ GlobalContext --------
 
 
@@ -16,8 +20,12 @@ from my_project.model import (
 class GlobalContext:
     cantus_firmus: list[Pitch]
     rythmn_type: RythmnType
-    completed_measures: list[AnnotatedMeasure]
+    completed_measures: tuple[AnnotatedMeasure, ...]
     next_measure_mark: Pitch | None
+    # 最後まで探索できた小節の探索結果。課題全体の探索で共有し、直前までの小節が異なっても同じ条件の探索結果を使い回す
+    local_search_memo: dict[LocalSearchKey, list[LocalMeasureContext]] = field(
+        default_factory=dict, compare=False, repr=False
+    )
 
     def __post_init__(self) -> None:
         # CFは空ではない。(通常は2つ以上。最小で1つだがそれは最終小節として扱われ全音符が実施されるだけになる。)
@@ -30,7 +38,7 @@ class GlobalContext:
         return cls(
             cantus_firmus=cantus_firmus,
             rythmn_type=rythmn_type,
-            completed_measures=[],
+            completed_measures=(),
             next_measure_mark=None,
         )
 
@@ -44,10 +52,10 @@ class GlobalContext:
 
         return replace(
             self,
-            completed_measures=[
+            completed_measures=(
                 *self.completed_measures,
                 AnnotatedMeasure(local_ctx.note_buffer),
-            ],
+            ),
             next_measure_mark=local_ctx.next_measure_mark,
         )
 
@@ -61,11 +69,23 @@ class GlobalContext:
             is_first_measure=self._is_first_measure(),
             is_last_measure=self._is_last_measure(),
             is_next_last_measure=self._is_next_last_measure(),
-            note_buffer=[],
+            note_buffer=(),
             is_root_chord=None,
             next_measure_mark=self.next_measure_mark,
         )
 
+    def local_search_key(self) -> LocalSearchKey:
+        """
+        new_local_measure_countext から始まる小節の探索結果を決める値の組みを返す。
+        CF とリズムは課題全体で共通なので、完了済みの小節数と直前の小節、次の小節の冒頭のマークで決まる。
+        """
+        previous_measure = self._previous_measure()
+        return (
+            len(self.completed_measures),
+            previous_measure.annotated_notes if previous_measure is not None else None,
+            self.next_measure_mark,
+        )
+
     def is_measures_fulfilled(self) -> bool:
         return len(self.completed_measures) == len(self.cantus_firmus)
 
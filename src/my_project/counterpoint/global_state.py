@@ -1,10 +1,13 @@
+import itertools
+import multiprocessing
 import random
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
 from dataclasses import dataclass
+from multiprocessing.queues import Queue
 
 import my_project.counterpoint.all_measure_validator as all_measure_validator
-from my_project.counterpoint.global_context import GlobalContext
+from my_project.counterpoint.global_context import GlobalContext, LocalSearchKey
 from my_project.counterpoint.local_measure_context import LocalMeasureContext
 from my_project.counterpoint.local_measure_state import ChooseSearchState, MeasureEndState
 from my_project.counterpoint.model import (
@@ -12,10 +15,10 @@ from my_project.counterpoint.model import (
     KEY,
     REALIZE_PART_ID,
     TIME_SIGNATURE,
+    WHOLE_NOTE_DURATION,
     RythmnType,
 )
 from my_project.model import (
-    Duration,
     Measure,
     Note,
     Part,
@@ -24,10 +27,74 @@ from my_project.model import (
 )
 from my_project.util import shuffled_interleave
 
+# generate_parallel で、各プロセスが呼び出し側に読まれるのを待たずに返せる解の数
+PARALLEL_RESULT_QUEUE_SIZE = 64
+
 
 def generate(cantus_firmus: list[Pitch], rythmn_type: RythmnType) -> Iterator[Score]:
     random.seed()
-    return map(lambda state: state.to_score(), GlobalState.start_state(cantus_firmus, rythmn_type).final_states())
+    return (state.to_score() for state in GlobalState.start_state(cantus_firmus, rythmn_type).final_states())
+
+
+def generate_parallel(
+    cantus_firmus: list[Pitch],
+    rythmn_type: RythmnType,
+    max_workers: int | None = None,
+    limit_per_subtree: int | None = None,
+) -> Iterator[Score]:
+    """
+    generate を複数のプロセスで行う。
+    1小節目の探索結果ごとに以降の探索は独立しているため、それぞれの部分木を別のプロセスで探索する。
+    各プロセスは部分木の解を limit_per_subtree 個まで(None の場合は全て)、見つけた順にキューで返す。
+    """
+    random.seed()
+    start_state = GlobalState.start_state(cantus_firmus, rythmn_type)
+    subtree_states = list(start_state.next_states())
+    random.shuffle(subtree_states)
+
+    # 呼び出し側が読むよりも速く解が見つかった場合に、メモリを使い続けないよう各プロセスを待たせる
+    result_queue: Queue[Score | None] = multiprocessing.Queue(maxsize=PARALLEL_RESULT_QUEUE_SIZE)
+
+    # 呼び出し側が途中で読むのをやめた場合は、 with を抜ける時に探索中のプロセスも終了させる
+    with multiprocessing.Pool(
+        processes=max_workers, initializer=_init_subtree_worker, initargs=(result_queue,)
+    ) as pool:
+        async_results = [pool.apply_async(_put_subtree_scores, (state, limit_per_subtree)) for state in subtree_states]
+        remaining_subtrees = len(subtree_states)
+        while remaining_subtrees > 0:
+            score = result_queue.get()
+            if score is None:
+                # 部分木の探索が終わった
+                remaining_subtrees -= 1
+            else:
+                yield score
+        # 部分木の探索中に起きた例外を呼び出し側に伝える
+        for async_result in async_results:
+            async_result.get()
+
+
+# generate_parallel の各プロセスが解を返すキュー。プロセスの開始時に _init_subtree_worker で設定される
+_result_queue: "Queue[Score | None] | None" = None
+
+
+def _init_subtree_worker(result_queue: "Queue[Score | None]") -> None:
+    global _result_queue
+    _result_queue = result_queue
+
+
+def _put_subtree_scores(state: "GlobalState", limit: int | None) -> None:
+    """
+    generate_parallel の各プロセスで実行される部分木の探索。
+    解を見つけるたびにキューに入れ、探索が終わったら None を入れる。
+    """
+    assert _result_queue is not None
+    # fork されたプロセスで同じ乱数列にならないようにする
+    random.seed()
+    try:
+        for end_state in itertools.islice(state.final_states(), limit):
+            _result_queue.put(end_state.to_score())
+    finally:
+        _result_queue.put(None)
 
 
 class GlobalState(ABC):
@@ -35,6 +102,9 @@ class GlobalState(ABC):
     課題全体を解くステート
     """
 
+    # 探索中に大量に生成されるため、サブクラスも含めて __dict__ を持たせない
+    __slots__ = ()
+
     global_ctx: GlobalContext
 
     @classmethod
@@ -66,7 +136,7 @@ class GlobalState(ABC):
         return (s for s in self._find_terminal_states(randomized) if isinstance(s, EndState))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GenerateMeasureState(GlobalState):
     """
     小節を生成するステート。LocalMeasureStateとの橋渡しの役目を担う。
@@ -75,22 +145,45 @@ class GenerateMeasureState(GlobalState):
     global_ctx: GlobalContext
 
     def next_states(self) -> Iterator[GlobalState]:
-        local_ctx: LocalMeasureContext = self.global_ctx.new_local_measure_countext()
-
-        start_local_state = ChooseSearchState(local_ctx)
-        local_final_states: Iterator[MeasureEndState] = start_local_state.final_states()
+        memo = self.global_ctx.local_search_memo
+        memo_key = self.global_ctx.local_search_key()
+
+        local_end_ctxs: Iterator[LocalMeasureContext]
+        if memo_key in memo:
+            # 同じ条件の小節は探索済みなので結果を使い回す。結果にバラエティを持たせるためにランダムに並び替える
+            cached_ctxs = memo[memo_key][:]
+            random.shuffle(cached_ctxs)
+            local_end_ctxs = iter(cached_ctxs)
+        else:
+            local_ctx: LocalMeasureContext = self.global_ctx.new_local_measure_countext()
+            local_end_ctxs = self._search_local_measure(local_ctx, memo_key)
 
-        def create_next_global_state(measure_end_state: MeasureEndState) -> GlobalState:
-            new_global_ctx = self.global_ctx.local_ctx_appended(measure_end_state.local_ctx)
+        def create_next_global_state(local_end_ctx: LocalMeasureContext) -> GlobalState:
+            new_global_ctx = self.global_ctx.local_ctx_appended(local_end_ctx)
             if new_global_ctx.is_measures_fulfilled():
                 return ValidatingAllMeasureState(new_global_ctx)
             else:
                 return GenerateMeasureState(new_global_ctx)
 
-        yield from map(create_next_global_state, local_final_states)
+        yield from map(create_next_global_state, local_end_ctxs)
+
+    def _search_local_measure(
+        self, local_ctx: LocalMeasureContext, memo_key: LocalSearchKey
+    ) -> Iterator[LocalMeasureContext]:
+        """
+        小節を探索する。最後まで探索できた場合は結果を local_search_memo に記録する。
+        """
+        start_local_state = ChooseSearchState(local_ctx)
+        local_final_states: Iterator[MeasureEndState] = start_local_state.final_states()
+
+        results: list[LocalMeasureContext] = []
+        for measure_end_state in local_final_states:
+            results.append(measure_end_state.local_ctx)
+            yield measure_end_state.local_ctx
+        self.global_ctx.local_search_memo[memo_key] = results
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ValidatingAllMeasureState(GlobalState):
     """
     課題全体のバリデーション中
@@ -108,7 +201,7 @@ class ValidatingAllMeasureState(GlobalState):
 # ------------ EndState --------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EndState(GlobalState):
     """
     課題全体のバリデーションが終わり、生成が完了した状態。
@@ -120,7 +213,7 @@ class EndState(GlobalState):
         raise RuntimeError("not called")
 
     def to_score(self) -> Score:
-        cf_notes = [Note(pitch, Duration.of(4)) for pitch in self.global_ctx.cantus_firmus]
+        cf_notes = [Note(pitch, WHOLE_NOTE_DURATION) for pitch in self.global_ctx.cantus_firmus]
         cf_measures = [Measure([note]) for note in cf_notes]
 
         realized_measures = [am.to_measure() for am in self.global_ctx.completed_measures]
@@ -138,7 +231,7 @@ class EndState(GlobalState):
 # ------------ PrunedState --------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PrunedState(GlobalState):
     """
     課題全体のバリデーションに失敗した。
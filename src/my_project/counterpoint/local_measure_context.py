@@ -13,7 +13,7 @@ from my_project.model import (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LocalMeasureContext:
     previous_measure: AnnotatedMeasure | None
     previous_cf: Pitch | None
@@ -28,7 +28,7 @@ class LocalMeasureContext:
     is_next_last_measure: bool  # 次の小節は最終小節か。経過音の探索で利用する
 
     # 現在構築中の音符バッファ。最大で一小節に相当する音価の音が入る。最大の要素数は rythmn_type に依存する。
-    note_buffer: list[AnnotatedNote]
+    note_buffer: tuple[AnnotatedNote, ...]
     # 和音の設定。基本形は True, 第一転回形の場合は False, 未設定の場合は None
     is_root_chord: bool | None
 
@@ -52,7 +52,7 @@ class LocalMeasureContext:
         """
         バッファにある音価の合計。4未満の場合は探索中、4であれば探索完了を表す。
         """
-        return sum([an.note.duration for an in self.note_buffer], Duration.of(0))
+        return Duration(sum(an.note.duration.ticks for an in self.note_buffer))
 
     def current_offset(self) -> Offset:
         """
@@ -60,7 +60,7 @@ class LocalMeasureContext:
         探索完了の場合に呼び出すと例外を出す。
         (total_note_buffer_durationよりも厳しい)
         """
-        offset = Offset(self.total_note_buffer_duration().value)
+        offset = Offset(self.total_note_buffer_duration().ticks)
         if offset in [Offset.of(0), Offset.of(1), Offset.of(2), Offset.of(3)]:
             return offset
         else:
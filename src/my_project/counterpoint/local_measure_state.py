@@ -23,6 +23,9 @@ from my_project.util import shuffled_interleave
 
 
 class LocalMeasureState(ABC):
+    # 探索中に大量に生成されるため、サブクラスも含めて __dict__ を持たせない
+    __slots__ = ()
+
     local_ctx: LocalMeasureContext
 
     @abstractmethod
@@ -49,7 +52,7 @@ class LocalMeasureState(ABC):
         return (s for s in self._find_terminal_states(randomized) if isinstance(s, MeasureEndState))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChooseSearchState(LocalMeasureState):
     """
     小節の探索方法を選ぶか、バリデーションの状態に移動する
@@ -65,12 +68,10 @@ class ChooseSearchState(LocalMeasureState):
         elif self.local_ctx.is_first_measure and self.local_ctx.current_offset() == Offset.of(0):
             yield SearchingStartNoteState(self.local_ctx)
         else:
-            next_states: list[LocalMeasureState] = [
-                SearchingHarmonicNoteInMeasureState(self.local_ctx),
-                SearchingPassingNoteInMeasureState(self.local_ctx),
-                SearchingNeighborNoteInMeasureState(self.local_ctx),
-            ]
-            yield from next_states
+            # 呼び出し側が探索を打ち切った場合に作らずに済むよう、ステートは取り出されるたびに作成する
+            yield SearchingHarmonicNoteInMeasureState(self.local_ctx)
+            yield SearchingPassingNoteInMeasureState(self.local_ctx)
+            yield SearchingNeighborNoteInMeasureState(self.local_ctx)
 
 
 class SearchNoteState(LocalMeasureState):
@@ -78,6 +79,8 @@ class SearchNoteState(LocalMeasureState):
     音を追加する系ステート
     """
 
+    __slots__ = ()
+
     local_ctx: LocalMeasureContext
 
     @abstractmethod
@@ -86,13 +89,14 @@ class SearchNoteState(LocalMeasureState):
 
     def next_states(self) -> Iterator[LocalMeasureState]:
         new_local_ctxs = self.next_ctxs()
-        # 結果にバラエティを持たせるためにランダムに並び替える
+        # 結果にバラエティを持たせるためにランダムに並び替える。
+        # next_ctxs が返したリストをそのまま並び替え、ステートは取り出されるたびに作成する
         random.shuffle(new_local_ctxs)
-        next_states = [ChooseSearchState(new_local_ctx) for new_local_ctx in new_local_ctxs]
-        yield from next_states
+        for new_local_ctx in new_local_ctxs:
+            yield ChooseSearchState(new_local_ctx)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SearchingStartNoteState(SearchNoteState):
     """
     課題冒頭の音を選択する
@@ -108,7 +112,7 @@ class SearchingStartNoteState(SearchNoteState):
         return search_start_note.next_ctxs(self.local_ctx)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SearchingEndNoteState(SearchNoteState):
     """
     課題の最後の小節の和声音を選択する
@@ -123,7 +127,7 @@ class SearchingEndNoteState(SearchNoteState):
         return search_end_note.next_ctxs(self.local_ctx)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SearchingHarmonicNoteInMeasureState(SearchNoteState):
     """
     小節内の探索中。和声音を1音追加する
@@ -138,7 +142,7 @@ class SearchingHarmonicNoteInMeasureState(SearchNoteState):
         return search_harmonic_note.next_ctxs(self.local_ctx)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SearchingPassingNoteInMeasureState(SearchNoteState):
     """
     小節内の探索中。経過音を追加する。note_bufferに2つ以上の音が追加され、next_measure_markが付くこともある。
@@ -153,7 +157,7 @@ class SearchingPassingNoteInMeasureState(SearchNoteState):
         return search_passing_tone.next_ctxs(self.local_ctx)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SearchingNeighborNoteInMeasureState(SearchNoteState):
     """
     小節内の探索中。刺繍音を追加する。note_bufferに2つの音が追加され、next_measure_markが付くこともある。
@@ -168,7 +172,7 @@ class SearchingNeighborNoteInMeasureState(SearchNoteState):
         return search_neighbor_tone.next_ctxs(self.local_ctx)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ValidatingInMeasureState(LocalMeasureState):
     """
     小節内のバリデーション中。
@@ -190,7 +194,7 @@ class ValidatingInMeasureState(LocalMeasureState):
             yield MeasureEndState(self.local_ctx)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MeasurePrunedState(LocalMeasureState):
     """
     小節のバリデーションに失敗した。
@@ -203,7 +207,7 @@ class MeasurePrunedState(LocalMeasureState):
         raise RuntimeError("not called")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MeasureEndState(LocalMeasureState):
     """
     小節のバリデーションが終わり、生成が完了した状態。
@@ -1,6 +1,6 @@
 import argparse
 
-from my_project.counterpoint.global_state import generate
+from my_project.counterpoint.global_state import generate, generate_parallel
 from my_project.counterpoint.model import RythmnType
 from my_project.lilypond_writer import score_to_lilypond
 from my_project.model import PartId, Pitch
@@ -21,6 +21,13 @@ def main() -> None:
         help="Rythmn type for counterpoint generation (e.g., quater, half, whole). Defaults to quater.",
     )
 
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of worker processes to search independent branches in parallel. Defaults to a single process.",
+    )
+
     parser.add_argument(
         "--debug",
         action="store_true",
@@ -47,14 +54,24 @@ def main() -> None:
         rythmn_type = RythmnType.QUATER_NOTE
 
     if args.debug:
-        for i, solved in enumerate(generate(cantus_firmus, rythmn_type=rythmn_type)):
+        if args.jobs is not None:
+            solutions = generate_parallel(cantus_firmus, rythmn_type=rythmn_type, max_workers=args.jobs)
+        else:
+            solutions = generate(cantus_firmus, rythmn_type=rythmn_type)
+        for i, solved in enumerate(solutions):
             mesaures = next(part.measures for part in solved.parts if part.part_id == PartId.SOPRANO)
             pitches = [note.pitch.name() if note.pitch else "None" for measure in mesaures for note in measure.notes]
             print(f"試行 {i=}, {pitches}")
             # lily_str = score_to_lilypond(solved)
             # print(lily_str)
     else:
-        solved = next(generate(cantus_firmus, rythmn_type=rythmn_type))
+        if args.jobs is not None:
+            # 最初に見つかった解だけを使うため、各プロセスは解を1つ見つけた時点で探索を終える
+            solved = next(
+                generate_parallel(cantus_firmus, rythmn_type=rythmn_type, max_workers=args.jobs, limit_per_subtree=1)
+            )
+        else:
+            solved = next(generate(cantus_firmus, rythmn_type=rythmn_type))
         lily_str = score_to_lilypond(solved)
         print(lily_str)
 
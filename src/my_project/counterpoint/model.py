@@ -22,6 +22,11 @@ MEASURE_TOTAL_DURATION = Duration.of(NOTES_IN_MEASURE)
 CF_PART_ID = PartId.BASS
 REALIZE_PART_ID = PartId.SOPRANO
 
+# 探索中に大量に作られる音符で共有する音価
+QUATER_NOTE_DURATION = Duration.of(1)
+HALF_NOTE_DURATION = Duration.of(2)
+WHOLE_NOTE_DURATION = Duration.of(4)
+
 
 class RythmnType(Enum):
     """
@@ -38,11 +43,11 @@ class RythmnType(Enum):
     def note_duration(self) -> Duration:
         match self:
             case RythmnType.QUATER_NOTE:
-                return Duration.of(1)
+                return QUATER_NOTE_DURATION
             case RythmnType.HALF_NOTE:
-                return Duration.of(2)
+                return HALF_NOTE_DURATION
             case RythmnType.WHOLE_NOTE:
-                return Duration.of(4)
+                return WHOLE_NOTE_DURATION
 
 
 class ToneType(Enum):
@@ -58,17 +63,17 @@ class ToneType(Enum):
     NEIGHBOR_TONE = 3
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AnnotatedNote:
     note: Note
     tone_type: ToneType
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AnnotatedMeasure:
     """ToneType で注釈付けされた音符のリストを持つ小節"""
 
-    annotated_notes: list[AnnotatedNote]
+    annotated_notes: tuple[AnnotatedNote, ...]
 
     def to_measure(self) -> Measure:
         """Score 生成のために model.Measure に変換する"""
@@ -106,7 +111,8 @@ class AnnotatedMeasure:
             current_offset = note_end_offset
 
         raise ValueError(
-            f"Offset {offset.value} is out of bounds for this measure. Total duration is {current_offset.value}."
+            f"Offset {offset.to_fraction()} is out of bounds for this measure. "
+            f"Total duration is {current_offset.to_fraction()}."
         )
 
     def pitch_at(self, offset: Offset) -> Pitch | None:
@@ -12,6 +12,14 @@ from my_project.util import part_range, scale_pitches
 
 AVAILABLE_PITCHES_LIST: list[Pitch] = scale_pitches(KEY, part_range(REALIZE_PART_ID))
 AVAILABLE_PITCHES_SET: set[Pitch] = set(AVAILABLE_PITCHES_LIST)
+# 声域内の調の音と、その PitchNumber の値、C4 からの IntervalStep の値の組み。候補の絞り込みを整数のまま行うために使う
+AVAILABLE_PITCHES_WITH_NUM_STEP: list[tuple[Pitch, int, int]] = [
+    (p, p.num().value, 4 * p.note_name.value + 7 * p.octave.value) for p in AVAILABLE_PITCHES_LIST
+]
+# CF の上方で利用できる音程の上限(2オクターブ)の IntervalStep の値
+MAX_UPPER_STEP_VALUE: int = IntervalStep.idx_1(15).value
+# 冒頭または最終小節以外で協和音として利用できる、CF からの単音程の IntervalStep の値。1,3,5,6度
+CONSONANT_STEP_VALUES: frozenset[int] = frozenset(IntervalStep.idx_1(n).value for n in (1, 3, 5, 6))
 
 
 def available_harmonic_pitches_with_chord(local_ctx: LocalMeasureContext) -> list[tuple[Pitch, bool | None]]:
@@ -23,39 +31,47 @@ def available_harmonic_pitches_with_chord(local_ctx: LocalMeasureContext) -> lis
 
     cf = local_ctx.current_cf
 
-    step_and_next_chord_dict: dict[IntervalStep, bool | None] = {}
+    # キーは CF からの単音程の IntervalStep の値
+    step_and_next_chord_dict: dict[int, bool | None] = {}
     if local_ctx.is_root_chord is None:
         step_and_next_chord_dict = {
-            IntervalStep.idx_1(1): None,
-            IntervalStep.idx_1(3): None,
-            IntervalStep.idx_1(5): True,
-            IntervalStep.idx_1(6): False,
+            IntervalStep.idx_1(1).value: None,
+            IntervalStep.idx_1(3).value: None,
+            IntervalStep.idx_1(5).value: True,
+            IntervalStep.idx_1(6).value: False,
         }
     elif local_ctx.is_root_chord:
         step_and_next_chord_dict = {
-            IntervalStep.idx_1(1): True,
-            IntervalStep.idx_1(3): True,
-            IntervalStep.idx_1(5): True,
+            IntervalStep.idx_1(1).value: True,
+            IntervalStep.idx_1(3).value: True,
+            IntervalStep.idx_1(5).value: True,
         }
     else:
         step_and_next_chord_dict = {
-            IntervalStep.idx_1(1): False,
-            IntervalStep.idx_1(3): False,
-            IntervalStep.idx_1(6): False,
+            IntervalStep.idx_1(1).value: False,
+            IntervalStep.idx_1(3).value: False,
+            IntervalStep.idx_1(6).value: False,
         }
 
-    all_available_pitches = [
-        pitch
-        for pitch in AVAILABLE_PITCHES_LIST  # 声域内の調の音
-        if cf.num() <= pitch.num() and Interval.of(cf, pitch).step() <= IntervalStep.idx_1(15)  # 2オクターブ未満
+    return [
+        (pitch, step_and_next_chord_dict[step_value])
+        for pitch, step_value in _upper_pitches_with_normalized_step(cf)
+        if step_value in step_and_next_chord_dict
     ]
 
-    result: list[tuple[Pitch, bool | None]] = []
-    for pitch in all_available_pitches:
-        step = Interval.of(cf, pitch).normalize().step()
-        if step in step_and_next_chord_dict.keys():
-            result.append((pitch, step_and_next_chord_dict[step]))
-    return result
+
+def _upper_pitches_with_normalized_step(cf: Pitch) -> list[tuple[Pitch, int]]:
+    """
+    声域内の調の音のうち CF 以上で2オクターブ以内の音と、CF からの単音程の IntervalStep の値の組みを返す。
+    単音程の値は Interval.of(cf, pitch).normalize().step().value と等しいが、 Interval を作らずに整数のまま計算する。
+    """
+    cf_num = cf.num().value
+    cf_step = 4 * cf.note_name.value + 7 * cf.octave.value
+    return [
+        (pitch, abs(step - cf_step) % 7)
+        for pitch, num, step in AVAILABLE_PITCHES_WITH_NUM_STEP
+        if cf_num <= num and step - cf_step <= MAX_UPPER_STEP_VALUE
+    ]
 
 
 # def filter_available_pitches(local_ctx: LocalMeasureContext, pitches: list[Pitch]) -> list[Pitch]:
@@ -98,19 +114,7 @@ def available_pitches(local_ctx: LocalMeasureContext, cf: Pitch) -> list[Pitch]:
     CFの上方の1,3,5,6度とその複音程で、2オクターブの範囲、声域内。
     """
     return [
-        pitch
-        for pitch in AVAILABLE_PITCHES_LIST  # 声域内の調の音
-        if cf.num() <= pitch.num()
-        and Interval.of(cf, pitch).step() <= IntervalStep.idx_1(15)  # 2オクターブ未満
-        and (
-            Interval.of(cf, pitch).normalize().step()
-            in [
-                IntervalStep.idx_1(1),
-                IntervalStep.idx_1(3),
-                IntervalStep.idx_1(5),
-                IntervalStep.idx_1(6),
-            ]
-        )
+        pitch for pitch, step_value in _upper_pitches_with_normalized_step(cf) if step_value in CONSONANT_STEP_VALUES
     ]
 
 
@@ -34,22 +34,22 @@ def next_ctxs(local_ctx: LocalMeasureContext) -> list[LocalMeasureContext]:
         # 和音上利用できる音の中で、前の音との旋律的音程が許されるもの
         previous_pitch = local_ctx.previous_latest_added_pitch()
         all_candidates: list[tuple[Pitch, bool | None]] = available_harmonic_pitches_with_chord(local_ctx)
-        for next_pitch, next_is_root_chord in all_candidates:
-            if is_valid_melodic_interval(local_ctx, next_pitch - previous_pitch):
-                next_pitch_and_chord_list.append((next_pitch, next_is_root_chord))
+        next_pitch_and_chord_list = [
+            (next_pitch, next_is_root_chord)
+            for next_pitch, next_is_root_chord in all_candidates
+            if is_valid_melodic_interval(local_ctx, next_pitch - previous_pitch)
+        ]
 
-    next_ctxs: list[LocalMeasureContext] = []
-    for next_pitch, next_is_root_chord in next_pitch_and_chord_list:
-        duration = local_ctx.rythmn_type.note_duration()
-        new_local_ctx = replace(
+    duration = local_ctx.rythmn_type.note_duration()
+    return [
+        replace(
             local_ctx,
-            note_buffer=[
+            note_buffer=(
                 *local_ctx.note_buffer,
                 make_annotated_note(next_pitch, ToneType.HARMONIC_TONE, duration),
-            ],
+            ),
             next_measure_mark=None,
             is_root_chord=next_is_root_chord,
         )
-        next_ctxs.append(new_local_ctx)
-
-    return next_ctxs
+        for next_pitch, next_is_root_chord in next_pitch_and_chord_list
+    ]
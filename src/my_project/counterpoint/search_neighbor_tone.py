@@ -15,6 +15,9 @@ from my_project.model import (
 )
 from my_project.util import add_interval_step_in_key
 
+# 刺繍音として利用する、直前の音からの音程。2度上・2度下
+NEIGHBOR_STEPS: tuple[IntervalStep, ...] = (IntervalStep.idx_1(2), IntervalStep.idx_1(-2))
+
 
 def next_ctxs(local_ctx: LocalMeasureContext) -> list[LocalMeasureContext]:
     """
@@ -31,24 +34,24 @@ def next_ctxs(local_ctx: LocalMeasureContext) -> list[LocalMeasureContext]:
     # 最終小節ではないので次の小節のCFは必ず取得できる
     assert local_ctx.next_measure_cf is not None
 
-    next_ctxs: list[LocalMeasureContext] = []
+    previous_pitch = local_ctx.previous_latest_added_pitch()
+    duration = local_ctx.rythmn_type.note_duration()
 
     # 小節を跨ぐ場合と跨がない場合で大きく分岐して考える
     if _is_target_note_in_current_measure(local_ctx):
         # 小節を跨がない場合は、直前に追加した音が和声音であるため、音域内であれば利用可能
-        for neighbor_note_pitch in _available_neighbor_note_pitches(local_ctx):
-            previous_pitch = local_ctx.previous_latest_added_pitch()
-            duration = local_ctx.rythmn_type.note_duration()
-            new_local_ctx = replace(
+        return [
+            replace(
                 local_ctx,
-                note_buffer=[
+                note_buffer=(
                     *local_ctx.note_buffer,
                     make_annotated_note(neighbor_note_pitch, ToneType.NEIGHBOR_TONE, duration),
                     make_annotated_note(previous_pitch, ToneType.HARMONIC_TONE, duration),
-                ],
+                ),
                 next_measure_mark=None,
             )
-            next_ctxs.append(new_local_ctx)
+            for neighbor_note_pitch in _available_neighbor_note_pitches(local_ctx)
+        ]
     else:
         # 小節を跨ぐ場合、最終小節かどうかに応じて利用できる音高を求め、その中に直前の音が含まれるかを確認する
         if local_ctx.is_next_last_measure:
@@ -56,24 +59,19 @@ def next_ctxs(local_ctx: LocalMeasureContext) -> list[LocalMeasureContext]:
         else:
             a_pitches = set(available_pitches(local_ctx, local_ctx.next_measure_cf))
 
-        previous_pitch = local_ctx.previous_latest_added_pitch()
-        if previous_pitch in a_pitches:
-            for neighbor_note_pitch in _available_neighbor_note_pitches(local_ctx):
-                new_local_ctx = replace(
-                    local_ctx,
-                    note_buffer=[
-                        *local_ctx.note_buffer,
-                        make_annotated_note(
-                            neighbor_note_pitch,
-                            ToneType.NEIGHBOR_TONE,
-                            local_ctx.rythmn_type.note_duration(),
-                        ),
-                    ],
-                    next_measure_mark=previous_pitch,
-                )
-                next_ctxs.append(new_local_ctx)
-
-    return next_ctxs
+        if previous_pitch not in a_pitches:
+            return []
+        return [
+            replace(
+                local_ctx,
+                note_buffer=(
+                    *local_ctx.note_buffer,
+                    make_annotated_note(neighbor_note_pitch, ToneType.NEIGHBOR_TONE, duration),
+                ),
+                next_measure_mark=previous_pitch,
+            )
+            for neighbor_note_pitch in _available_neighbor_note_pitches(local_ctx)
+        ]
 
 
 def _available_neighbor_note_pitches(local_ctx: LocalMeasureContext) -> list[Pitch]:
@@ -82,13 +80,12 @@ def _available_neighbor_note_pitches(local_ctx: LocalMeasureContext) -> list[Pit
     2度上・2度下
     """
     previous_latest_added_pitch = local_ctx.previous_latest_added_pitch()
-    neighbor_steps = [IntervalStep.idx_1(2), IntervalStep.idx_1(-2)]
-    result: list[Pitch] = []
-    for step in neighbor_steps:
-        neighbor_pitch = add_interval_step_in_key(KEY, previous_latest_added_pitch, step)
-        if neighbor_pitch in AVAILABLE_PITCHES_SET:  # 声域内か
-            result.append(neighbor_pitch)
-    return result
+    return [
+        neighbor_pitch
+        for step in NEIGHBOR_STEPS
+        if (neighbor_pitch := add_interval_step_in_key(KEY, previous_latest_added_pitch, step))
+        in AVAILABLE_PITCHES_SET  # 声域内か
+    ]
 
 
 def _is_target_note_in_current_measure(local_ctx: LocalMeasureContext) -> bool:
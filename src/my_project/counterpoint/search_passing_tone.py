@@ -1,4 +1,5 @@
 from dataclasses import replace
+from functools import cache
 
 from my_project.counterpoint.local_measure_context import LocalMeasureContext
 from my_project.counterpoint.model import (
@@ -42,10 +43,13 @@ def next_ctxs(local_ctx: LocalMeasureContext) -> list[LocalMeasureContext]:
         current_offset=local_ctx.current_offset(), rythmn_type=local_ctx.rythmn_type
     )
 
+    previous_pitch = local_ctx.previous_latest_added_pitch()
+    duration = local_ctx.rythmn_type.note_duration()
+
     next_ctxs: list[LocalMeasureContext] = []
     for step, is_target_note_in_current_number in patterns:
         # 到達する音高を求める
-        target_pitch = add_interval_step_in_key(KEY, local_ctx.previous_latest_added_pitch(), step)
+        target_pitch = add_interval_step_in_key(KEY, previous_pitch, step)
 
         # 小節を跨ぐ場合と跨がない場合で大きく分岐して考える
         if is_target_note_in_current_number:
@@ -54,23 +58,26 @@ def next_ctxs(local_ctx: LocalMeasureContext) -> list[LocalMeasureContext]:
             # 小節を跨がない場合、到達した音は課題の冒頭の音または最終小節以外の音である。
             # それらの利用できる音を求める
             available_pitches_and_next_chord = available_harmonic_pitches_with_chord(local_ctx)
-
-            for available_pitch, is_next_root_chord in available_pitches_and_next_chord:
-                if target_pitch != available_pitch:
-                    continue
-
-                duration = local_ctx.rythmn_type.note_duration()
-                pitches = conjunct_pitches(KEY, local_ctx.previous_latest_added_pitch(), step)
-                init_notes = [make_annotated_note(p, ToneType.PASSING_TONE, duration) for p in pitches[:-1]]
-                last_note = make_annotated_note(pitches[-1], ToneType.HARMONIC_TONE, duration)
-                new_local_ctx = replace(
+            next_root_chords = [
+                is_next_root_chord
+                for available_pitch, is_next_root_chord in available_pitches_and_next_chord
+                if target_pitch == available_pitch
+            ]
+            if not next_root_chords:
+                continue
+
+            pitches = _conjunct_pitches(KEY, previous_pitch, step)
+            init_notes = [make_annotated_note(p, ToneType.PASSING_TONE, duration) for p in pitches[:-1]]
+            last_note = make_annotated_note(pitches[-1], ToneType.HARMONIC_TONE, duration)
+            next_ctxs.extend(
+                replace(
                     local_ctx,
-                    note_buffer=[*local_ctx.note_buffer, *init_notes, last_note],
+                    note_buffer=(*local_ctx.note_buffer, *init_notes, last_note),
                     next_measure_mark=None,
                     is_root_chord=is_next_root_chord,
                 )
-                next_ctxs.append(new_local_ctx)
-            pass
+                for is_next_root_chord in next_root_chords
+            )
         else:
             # 小節を跨ぐ場合
 
@@ -82,23 +89,21 @@ def next_ctxs(local_ctx: LocalMeasureContext) -> list[LocalMeasureContext]:
             else:
                 a_pitches = available_pitches(local_ctx, local_ctx.next_measure_cf)
 
-            for available_pitch in a_pitches:
-                if target_pitch != available_pitch:
-                    continue
+            # 利用できる音高は重複しないので、到達する音高が含まれるかどうかだけを確認する
+            if target_pitch not in a_pitches:
+                continue
 
-                pitches = conjunct_pitches(KEY, local_ctx.previous_latest_added_pitch(), step)
-                notes_to_add_buffer = [
-                    make_annotated_note(p, ToneType.PASSING_TONE, local_ctx.rythmn_type.note_duration())
-                    for p in pitches[:-1]
-                ]
-                next_measure_mark = pitches[-1]
+            pitches = _conjunct_pitches(KEY, previous_pitch, step)
+            notes_to_add_buffer = [make_annotated_note(p, ToneType.PASSING_TONE, duration) for p in pitches[:-1]]
+            next_measure_mark = pitches[-1]
 
-                new_local_ctx = replace(
+            next_ctxs.append(
+                replace(
                     local_ctx,
-                    note_buffer=[*local_ctx.note_buffer, *notes_to_add_buffer],
+                    note_buffer=(*local_ctx.note_buffer, *notes_to_add_buffer),
                     next_measure_mark=next_measure_mark,
                 )
-                next_ctxs.append(new_local_ctx)
+            )
 
     return next_ctxs
 
@@ -113,6 +118,15 @@ def conjunct_pitches(key: Key, pitch: Pitch, interval_step: IntervalStep) -> lis
     例: key=C major, pitch = C4, interval_step = IntervalStep_idx_1(-4) -> [B3, A3, G3]
     例: key=C major, pitch = C4, interval_step = IntervalStep_idx_1(1) -> []
     """
+    # 経過音の探索のたびに同じ組み合わせで呼ばれるため、計算結果をキャッシュして呼び出し側には複製を返す
+    return list(_conjunct_pitches(key, pitch, interval_step))
+
+
+@cache
+def _conjunct_pitches(key: Key, pitch: Pitch, interval_step: IntervalStep) -> tuple[Pitch, ...]:
+    """
+    conjunct_pitches の計算部分。
+    """
 
     steps: list[IntervalStep]
     if interval_step == IntervalStep(0):
@@ -122,7 +136,7 @@ def conjunct_pitches(key: Key, pitch: Pitch, interval_step: IntervalStep) -> lis
     else:
         steps = [IntervalStep(v) for v in range(-1, interval_step.value - 1, -1)]
 
-    return [add_interval_step_in_key(key, pitch, step) for step in steps]
+    return tuple(add_interval_step_in_key(key, pitch, step) for step in steps)
 
 
 def progression_pattern(current_offset: Offset, rythmn_type: RythmnType) -> list[tuple[IntervalStep, bool]]:
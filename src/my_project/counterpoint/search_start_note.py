@@ -17,18 +17,18 @@ def next_ctxs(local_ctx: LocalMeasureContext) -> list[LocalMeasureContext]:
     next_ctxs: list[LocalMeasureContext] = []
     for pitch in possible_pitches:
         duration = local_ctx.rythmn_type.note_duration()
-        note_buffer: list[AnnotatedNote]
+        note_buffer: tuple[AnnotatedNote, ...]
         match local_ctx.rythmn_type:
             case RythmnType.WHOLE_NOTE:
                 # 全音符の場合は冒頭の休符はなく、音符だけ入れる
-                note_buffer = [make_annotated_note(pitch, ToneType.HARMONIC_TONE, duration)]
+                note_buffer = (make_annotated_note(pitch, ToneType.HARMONIC_TONE, duration),)
 
             case _:
                 # その他の場合は休符と音符を入れる
-                note_buffer = [
+                note_buffer = (
                     make_annotated_note(None, ToneType.HARMONIC_TONE, duration),
                     make_annotated_note(pitch, ToneType.HARMONIC_TONE, duration),
-                ]
+                )
         new_local_ctx = replace(
             local_ctx,
             note_buffer=note_buffer,
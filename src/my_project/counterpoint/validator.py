@@ -1,7 +1,6 @@
 from my_project.counterpoint.local_measure_context import LocalMeasureContext
-from my_project.counterpoint.model import AnnotatedMeasure, AnnotatedNote, ToneType
+from my_project.counterpoint.model import WHOLE_NOTE_DURATION, AnnotatedMeasure, AnnotatedNote, ToneType
 from my_project.model import (
-    Duration,
     Interval,
     IntervalStep,
     Note,
@@ -10,6 +9,46 @@ from my_project.model import (
 )
 from my_project.util import sliding
 
+# 連続5度・8度の禁則となる、正規化した2つの音程の組み
+PARALLEL_VIOLATION_INTERVALS: frozenset[tuple[Interval, Interval]] = frozenset(
+    {
+        (Interval.parse("P1"), Interval.parse("P1")),  # 連続8度(1度)
+        (Interval.parse("P5"), Interval.parse("P5")),  # 連続5度(完全-完全)
+        (Interval.parse("d5"), Interval.parse("P5")),  # 連続5度(減-完全)
+        # 連続5度(完全-減) 3声からは許されるが、現在は2声のみ扱うので禁則扱い
+        (Interval.parse("P5"), Interval.parse("d5")),
+    }
+)
+# 並達5度・8度の禁則となる、正規化した後続の音程
+HIDDEN_VIOLATION_INTERVALS: frozenset[Interval] = frozenset({Interval.parse("P1"), Interval.parse("P5")})
+
+# 分散和音となる、3音の1音目から2音目・3音目への音程の IntervalStep の値の組み
+ARPEGGIIO_STEP_VALUES: frozenset[tuple[int, int]] = frozenset(
+    (IntervalStep.idx_1(s1).value, IntervalStep.idx_1(s2).value)
+    for s1, s2 in [
+        (3, 5),  # ドミソ
+        (-3, -5),
+        (3, 6),  # ミソド
+        (-3, -6),
+        (4, 6),  # ソドミ
+        (-4, -6),  # ソドミ
+    ]
+)
+# 第3音を伴わない分散和音となる、3音の1音目から2音目・3音目への音程の IntervalStep の値の組み
+ARPEGGIIO_EXTRA_STEP_VALUES: frozenset[tuple[int, int]] = frozenset(
+    (IntervalStep.idx_1(s1).value, IntervalStep.idx_1(s2).value)
+    for s1, s2 in [
+        (5, 8),  # [C4 G4 C5]
+        (-5, -8),
+        (4, 8),  # [G4 C5 G5]
+        (-4, -8),
+    ]
+)
+
+SECOND_STEP_VALUE: int = IntervalStep.idx_1(2).value
+SEVENTH_STEP_VALUE: int = IntervalStep.idx_1(7).value
+NINTH_STEP_VALUE: int = IntervalStep.idx_1(9).value
+
 
 def validate(local_ctx: LocalMeasureContext) -> bool:
     return validate_interval(local_ctx) and validate_melody(local_ctx)
@@ -64,18 +103,22 @@ def validate_interval(local_ctx: LocalMeasureContext) -> bool:
 
     # 簡単のため、小節と現在の小節を繋げた1小節を考え、Offset.of(4)以降のものに対して確認をする
     cf_measure = AnnotatedMeasure(
-        [
-            AnnotatedNote(Note(previous_cf, Duration.of(4)), ToneType.HARMONIC_TONE),
-            AnnotatedNote(Note(current_cf, Duration.of(4)), ToneType.HARMONIC_TONE),
-        ]
+        (
+            AnnotatedNote(Note(previous_cf, WHOLE_NOTE_DURATION), ToneType.HARMONIC_TONE),
+            AnnotatedNote(Note(current_cf, WHOLE_NOTE_DURATION), ToneType.HARMONIC_TONE),
+        )
     )
-    realize_measure = AnnotatedMeasure([*previous_measure.annotated_notes, *current_measure.annotated_notes])
-    for realize_current_offset, realize_current_a_note in realize_measure.offset_notes().items():
-        if realize_current_offset < Offset.of(4):
+    realize_measure = AnnotatedMeasure((*previous_measure.annotated_notes, *current_measure.annotated_notes))
+    # 二重ループの中で小節を辿り直さないよう、オフセットと音の組みは一度だけ求めておく
+    realize_offset_notes = list(realize_measure.offset_notes().items())
+    offset_0 = Offset.of(0)
+    offset_4 = Offset.of(4)
+    for realize_current_offset, realize_current_a_note in realize_offset_notes:
+        if realize_current_offset < offset_4:
             continue
-        for realize_previous_offset, realize_previous_a_note in realize_measure.offset_notes().items():
+        for realize_previous_offset, realize_previous_a_note in realize_offset_notes:
             # Offset の差が Duration.of(4) 以下の異なる2音を選ぶ。
-            if not (Offset.of(0) < realize_current_offset - realize_previous_offset <= Offset.of(4)):
+            if not (offset_0 < realize_current_offset - realize_previous_offset <= offset_4):
                 continue
             realize_current_pitch = realize_current_a_note.note.pitch
             realize_previous_pitch = realize_previous_a_note.note.pitch
@@ -165,29 +208,14 @@ def check_is_parallel_violation(sequence_1: tuple[Pitch, Pitch], sequence_2: tup
     連続5度・8度の禁則が含まれているかどうか。
     並行・反行のいずれも禁則とする。(斜行と同時保留はOK)
     """
-    if not (check_is_parallel_motion(sequence_1, sequence_2) or check_is_contrary_motion(sequence_1, sequence_2)):
+    # 並行・反行のいずれかであることは、2声のいずれも動いていることと同じ
+    if sequence_1[0] == sequence_1[1] or sequence_2[0] == sequence_2[1]:
         return False
 
     first_interval_normalized = Interval.of(sequence_1[0], sequence_2[0]).normalize()
     second_interval_normalized = Interval.of(sequence_1[1], sequence_2[1]).normalize()
 
-    # 連続8度(1度)
-    if first_interval_normalized == second_interval_normalized == Interval.parse("P1"):
-        return True
-
-    # 連続5度(完全-完全)
-    if first_interval_normalized == second_interval_normalized == Interval.parse("P5"):
-        return True
-
-    # 連続5度(減-完全)
-    if first_interval_normalized == Interval.parse("d5") and second_interval_normalized == Interval.parse("P5"):
-        return True
-
-    # 連続5度(完全-減) 3声からは許されるが、現在は2声のみ扱うので禁則扱い
-    if first_interval_normalized == Interval.parse("P5") and second_interval_normalized == Interval.parse("d5"):
-        return True
-
-    return False
+    return (first_interval_normalized, second_interval_normalized) in PARALLEL_VIOLATION_INTERVALS
 
 
 def is_hidden_interval_violation(sequence_1: tuple[Pitch, Pitch], sequence_2: tuple[Pitch, Pitch]) -> bool:
@@ -198,10 +226,7 @@ def is_hidden_interval_violation(sequence_1: tuple[Pitch, Pitch], sequence_2: tu
         return False
 
     second_interval_normalized = Interval.of(sequence_1[1], sequence_2[1]).normalize()
-    if second_interval_normalized in [Interval.parse("P1"), Interval.parse("P5")]:
-        return True
-    else:
-        return False
+    return second_interval_normalized in HIDDEN_VIOLATION_INTERVALS
 
 
 # --
@@ -241,23 +266,14 @@ def validate_melody_arpeggiio(local_ctx: LocalMeasureContext) -> bool:
     # 前の小節がもしあれば最後の2音を取得し、現在の小節と繋げた音列を作成
     pitches: list[Pitch] = [an.note.pitch for an in extended_note_buffer(local_ctx, 2) if an.note.pitch is not None]
 
-    arpeggiio_steps_list = [
-        [IntervalStep.idx_1(3), IntervalStep.idx_1(5)],  # ドミソ
-        [IntervalStep.idx_1(-3), IntervalStep.idx_1(-5)],
-        [IntervalStep.idx_1(3), IntervalStep.idx_1(6)],  # ミソド
-        [IntervalStep.idx_1(-3), IntervalStep.idx_1(-6)],
-        [IntervalStep.idx_1(4), IntervalStep.idx_1(6)],  # ソドミ
-        [IntervalStep.idx_1(-4), IntervalStep.idx_1(-6)],  # ソドミ
-    ]
-
     for ps in sliding(pitches, window_size=3):
         base, p1, p2 = ps
         intervals = [p1 - base, p2 - base]
         # NOTE: interval を normalize すると [C4 A3 A4] が C4に対して3度・6度と判定されてしまう。
         # NOTE: 複音程は旋律の規則としてそもそも選ばれないので無視してよい。例えば [C4 *E4 *G5] の10度は選ばれない。
-        # NOTE: 以下の steps を sort すると、反転の分散和音が判定に含まれる(その場合 arpeggiio_steps_list は上方だけでよい)
-        steps = [i.step() for i in intervals]
-        if steps in arpeggiio_steps_list:
+        # NOTE: 以下の steps を sort すると、反転の分散和音が判定に含まれる(その場合 ARPEGGIIO_STEP_VALUES は上方だけでよい)
+        steps = (intervals[0].step().value, intervals[1].step().value)
+        if steps in ARPEGGIIO_STEP_VALUES:
             return False
 
     return True
@@ -282,18 +298,11 @@ def validate_melody_arpeggiio_extra(local_ctx: LocalMeasureContext) -> bool:
     """
     pitches: list[Pitch] = [an.note.pitch for an in extended_note_buffer(local_ctx, 2) if an.note.pitch is not None]
 
-    arpeggiio_steps_list = [
-        [IntervalStep.idx_1(5), IntervalStep.idx_1(8)],  # [C4 G4 C5]
-        [IntervalStep.idx_1(-5), IntervalStep.idx_1(-8)],
-        [IntervalStep.idx_1(4), IntervalStep.idx_1(8)],  # [G4 C5 G5]
-        [IntervalStep.idx_1(-4), IntervalStep.idx_1(-8)],
-    ]
-
     for ps in sliding(pitches, window_size=3):
         base, p1, p2 = ps
         intervals = [p1 - base, p2 - base]
-        steps = [i.step() for i in intervals]
-        if steps in arpeggiio_steps_list:
+        steps = (intervals[0].step().value, intervals[1].step().value)
+        if steps in ARPEGGIIO_EXTRA_STEP_VALUES:
             return False
 
     return True
@@ -309,11 +318,11 @@ def validate_melody_interval_7_9(local_ctx: LocalMeasureContext) -> bool:
     pitches: list[Pitch] = [an.note.pitch for an in extended_note_buffer(local_ctx, 2) if an.note.pitch is not None]
     for ps in sliding(pitches, window_size=3):
         p1, p2, p3 = ps
-        step_1_3 = (p1 - p3).abs().step()
-        if step_1_3 == IntervalStep.idx_1(7) or step_1_3 > IntervalStep.idx_1(9):
-            step_1_2 = (p1 - p2).abs().step()
-            step_2_3 = (p2 - p3).abs().step()
-            if step_1_2 == IntervalStep.idx_1(2) or step_2_3 == IntervalStep.idx_1(2):
+        step_1_3 = (p1 - p3).abs().step().value
+        if step_1_3 == SEVENTH_STEP_VALUE or step_1_3 > NINTH_STEP_VALUE:
+            step_1_2 = (p1 - p2).abs().step().value
+            step_2_3 = (p2 - p3).abs().step().value
+            if step_1_2 == SECOND_STEP_VALUE or step_2_3 == SECOND_STEP_VALUE:
                 continue
             else:
                 return False
@@ -327,6 +336,6 @@ def extended_note_buffer(local_ctx: LocalMeasureContext, num: int) -> list[Annot
     """
     annotated_notes: list[AnnotatedNote] = []
     if local_ctx.previous_measure is not None:
-        annotated_notes.extend([an for an in local_ctx.previous_measure.annotated_notes[-2:]])
-    annotated_notes.extend([an for an in local_ctx.note_buffer])
+        annotated_notes.extend(local_ctx.previous_measure.annotated_notes[-2:])
+    annotated_notes.extend(local_ctx.note_buffer)
     return annotated_notes
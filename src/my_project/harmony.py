@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from fractions import Fraction
+from functools import cache
 
 from my_project.model import (
     Degree,
@@ -21,8 +22,13 @@ from my_project.model import (
 )
 from my_project.util import part_range, scale_pitches
 
+# 三和音の構成音の音度距離の集合(音度距離の値をビットの位置とした整数)から、その根音を引く表
+_TRIAD_STEPS_MASK_TO_ROOT: dict[int, DegreeStep] = {
+    (1 << root) | (1 << (root + 2) % 7) | (1 << (root + 4) % 7): DegreeStep(root) for root in range(7)
+}
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Chord:
     bass: Pitch
     tenor: Pitch
@@ -51,7 +57,7 @@ def solve(bass_sequence: list[Pitch], key: Key) -> Score:
 
 
 def _chords_to_score(chords: list[Chord], key: Key) -> Score:
-    duration = Duration(Fraction(2))
+    duration = Duration.of(2)
 
     sop_notes = [Note(c.soprano, duration) for c in chords]
     alto_notes = [Note(c.alto, duration) for c in chords]
@@ -71,16 +77,19 @@ def _chords_to_score(chords: list[Chord], key: Key) -> Score:
     return score
 
 
-def triad_note_names(bass: NoteName, key: Key) -> set[NoteName]:
+@cache
+def triad_note_names(bass: NoteName, key: Key) -> frozenset[NoteName]:
     """
     与えられたバスの音名と調によって三和音の基本形の構成音を返す
+    調とバスの音名の組み合わせは限られるので、計算結果をキャッシュする。
+    結果は呼び出し側で変更されないよう frozenset で返す
     """
 
     bass_degree = Degree.from_note_name_key(bass, key)
 
     # 基本形の和音ではバスに変位音はないため、指定されたら空のセットを返す
     if bass_degree.alter.value != 0:
-        return set()
+        return frozenset()
 
     # 第三音は短調のVの和音の場合上方変位する
     if bass_degree.step == DegreeStep.idx_1(5) and key.mode == Mode.MINOR:
@@ -92,7 +101,7 @@ def triad_note_names(bass: NoteName, key: Key) -> set[NoteName]:
 
     names = [Degree.note_name(degree, key) for degree in [bass_degree, third_degree, fifth_degree]]
 
-    return set(names)
+    return frozenset(names)
 
 
 def start_chord(bass: Pitch, key: Key) -> Chord:
@@ -137,18 +146,15 @@ def next_chord(next_bass: Pitch, key: Key, current_chord: Chord) -> Chord:
     # 音度距離同士の対応を作成する。
     # そのために、それぞれの和音の根音を求める。
 
-    current_chord_notes: set[NoteName] = triad_note_names(current_chord.bass.note_name, key)
-    current_chord_steps: set[DegreeStep] = set([Degree.from_note_name_key(n, key).step for n in current_chord_notes])
-
-    current_chord_root: DegreeStep | None = None
-    for i in range(0, 7):
-        root = DegreeStep(i)
-        steps: set[DegreeStep] = set([root, root + DegreeStep(2), root + DegreeStep(4)])
-        if steps == current_chord_steps:
-            current_chord_root = root
-            break
-    if not current_chord_root:
-        raise Exception(f"根音が見つかりません。 current_chord_steps: {current_chord_steps}")
+    current_chord_notes: frozenset[NoteName] = triad_note_names(current_chord.bass.note_name, key)
+    # 構成音の音度距離を、音度距離の値をビットの位置とした整数で表して表引きする
+    current_chord_steps_mask = 0
+    for n in current_chord_notes:
+        current_chord_steps_mask |= 1 << Degree.from_note_name_key(n, key).step.value
+
+    current_chord_root: DegreeStep | None = _TRIAD_STEPS_MASK_TO_ROOT.get(current_chord_steps_mask)
+    if current_chord_root is None:
+        raise Exception(f"根音が見つかりません。 current_chord_steps_mask: {current_chord_steps_mask:07b}")
 
     # 現在の和音の音度距離と次の和音の音度距離のマッピングを作成 (例: {v -> v, vii -> i, ii -> iii})
     # 根音が何度移動するかによって定める
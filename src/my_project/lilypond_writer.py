@@ -1,4 +1,5 @@
 from fractions import Fraction
+from functools import cache
 
 from my_project.model import Duration, Mode, Note, NoteName, PartId, Pitch, Score
 
@@ -15,22 +16,15 @@ def score_to_lilypond(score: Score) -> str:
     time_signature_string = score.time_signature.name()
 
     # Notes for each part
-    soprano_notes = ""
-    alto_notes = ""
-    tenor_notes = ""
-    bass_notes = ""
-
-    for part in score.parts:
-        # パート内の全ての音符を連結する
-        notes_str = " ".join(note_to_lilypond(note) for measure in part.measures for note in measure.notes)
-        if part.part_id == PartId.SOPRANO:
-            soprano_notes = notes_str
-        elif part.part_id == PartId.ALTO:
-            alto_notes = notes_str
-        elif part.part_id == PartId.TENOR:
-            tenor_notes = notes_str
-        elif part.part_id == PartId.BASS:
-            bass_notes = notes_str
+    # パートごとに全ての音符を一度の join で連結する
+    part_notes: dict[PartId, str] = {
+        part.part_id: " ".join(note_to_lilypond(note) for measure in part.measures for note in measure.notes)
+        for part in score.parts
+    }
+    soprano_notes = part_notes.get(PartId.SOPRANO, "")
+    alto_notes = part_notes.get(PartId.ALTO, "")
+    tenor_notes = part_notes.get(PartId.TENOR, "")
+    bass_notes = part_notes.get(PartId.BASS, "")
 
     return f"""\\version "2.24.4"
 
@@ -64,9 +58,11 @@ def note_to_lilypond(note: Note) -> str:
     return f"{pitch_rest_str}{duration_str}"
 
 
+@cache
 def pitch_to_lilypond(pitch: Pitch) -> str:
     """
     PitchオブジェクトをLilyPondの音符文字列に変換する
+    楽譜の中では同じ音高が繰り返し現れるため、変換結果をキャッシュする
     """
     _, _, octave = pitch.internal_pitch_notation()
 
@@ -86,29 +82,26 @@ def pitch_to_lilypond(pitch: Pitch) -> str:
 def note_name_to_lilypond(note_name: NoteName) -> str:
     step, alter = note_name.internal_pitch_notation()
 
-    lp_note = step.lower()
+    lp_step = step.lower()
 
-    if alter > 0:
-        lp_note += "is" * alter
-    elif alter < 0:
-        if alter == -1:
-            if lp_note == "a":
-                lp_note = "as"
-            elif lp_note == "e":
-                lp_note = "es"
-            else:
-                lp_note += "es"
-        else:  # alter < -1
-            if lp_note in "ae":
-                lp_note += "s" * (-alter)
-            else:
-                lp_note += "es" * (-alter)
+    if alter >= 0:
+        suffix = "is" * alter
+    elif lp_step in "ae":
+        # a と e のフラットは aes, ees ではなく as, es と綴る
+        suffix = "s" * (-alter)
+    else:
+        suffix = "es" * (-alter)
 
-    return lp_note
+    return lp_step + suffix
 
 
+@cache
 def duration_to_lilypond(duration: Duration) -> str:
-    val = duration.value
+    """
+    DurationオブジェクトをLilyPondの音価の文字列に変換する
+    楽譜の中で使われる音価は数種類しかないため、変換結果をキャッシュする
+    """
+    val = duration.to_fraction()
     if val == 0:
         return ""
 
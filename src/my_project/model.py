@@ -1,13 +1,26 @@
-import re
 from dataclasses import dataclass
 from enum import Enum
 from fractions import Fraction
 from typing import ClassVar
 
+## ----- 表記のパースに使う関数
+
+_DIGITS = "0123456789"
+
+
+def _split_number_suffix(name: str) -> tuple[str, str]:
+    """
+    "F##4" や "-m3" といった表記を、末尾の数字とそれより前の部分に分ける。数字がない場合は空文字列となる。
+    例: "F##4" -> ("F##", "4")
+    """
+    prefix = name.rstrip(_DIGITS)
+    return prefix, name[len(prefix) :]
+
+
 ## ----- 音名に対する定義
 
 
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, slots=True)
 class NoteName:
     value: int
 
@@ -16,10 +29,21 @@ class NoteName:
             raise ValueError("NoteName must be between -15 and 19.")
 
     def __add__(self, other: "NoteName") -> "NoteName":
-        return NoteName(self.value + other.value)
+        return NoteName.of(self.value + other.value)
 
     def __sub__(self, other: "NoteName") -> "NoteName":
-        return NoteName(self.value - other.value)
+        return NoteName.of(self.value - other.value)
+
+    @classmethod
+    def of(cls, value: int) -> "NoteName":
+        """
+        値から NoteName を得る。
+        音名の種類は限られるため、同じ値に対しては共有のオブジェクトを返す。
+        """
+        note_name = cls._POOL.get(value)
+        if note_name is None:
+            note_name = cls._POOL[value] = cls(value)
+        return note_name
 
     def name(self) -> str:
         """
@@ -32,16 +56,31 @@ class NoteName:
     def parse(cls, name: str) -> "NoteName":
         """
         "C#", "Bb", "F##" といった音名表記をパースしてNoteNameオブジェクトを作成する。
+        同じ表記に対しては一度作成したオブジェクトを返す。
         """
-        pattern = r"^([A-G])([#b]*)$"
-        match = re.fullmatch(pattern, name)
-        if not match:
+        cached = cls._PARSE_CACHE.get(name)
+        if cached is not None:
+            return cached
+
+        step_alter = cls._parse_step_alter(name)
+        if step_alter is None:
             raise ValueError(f"Invalid note name format: {name}")
 
-        step_str, accidental_str = match.groups()
-        alter = accidental_str.count("#") - accidental_str.count("b")
+        note_name = cls.from_internal_pitch_notation(*step_alter)
+        cls._PARSE_CACHE[name] = note_name
+        return note_name
 
-        return cls.from_internal_pitch_notation(step_str, alter)
+    @classmethod
+    def _parse_step_alter(cls, name: str) -> tuple[str, int] | None:
+        """
+        parse の字句解析部分。 "C#" といった表記を幹音と変化記号の値の組みに分ける。表記が不正な場合は None を返す
+        """
+        step_str = name[:1]
+        accidental_str = name[1:]
+        # 幹音は A から G のいずれか1文字、それ以降は # と b のみ
+        if step_str not in cls._STEP_TO_BASE_FIFTH or accidental_str.strip("#b"):
+            return None
+        return step_str, accidental_str.count("#") - accidental_str.count("b")
 
     def internal_pitch_notation(self) -> tuple[str, int]:
         """
@@ -60,15 +99,19 @@ class NoteName:
     @classmethod
     def from_internal_pitch_notation(cls, step: str, alter: int) -> "NoteName":
         base_fifth = cls._STEP_TO_BASE_FIFTH[step]
-        return NoteName(base_fifth + alter * 7)
+        return NoteName.of(base_fifth + alter * 7)
 
     # --- private maps for name/parse ---
 
     _STEP_TO_BASE_FIFTH: ClassVar[dict[str, int]] = {"C": 0, "D": 2, "E": 4, "F": -1, "G": 1, "A": 3, "B": 5}
     _BASE_FIFTH_TO_STEP: ClassVar[dict[int, str]] = {v: k for k, v in _STEP_TO_BASE_FIFTH.items()}
+    # parse の結果。テストや課題の定義で同じ表記が繰り返しパースされる
+    _PARSE_CACHE: ClassVar[dict[str, "NoteName"]] = {}
+    # of で共有する NoteName。値をキーとする
+    _POOL: ClassVar[dict[int, "NoteName"]] = {}
 
 
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, slots=True)
 class Octave:
     """
     音高のオクターブ成分を整数で表す。
@@ -83,7 +126,7 @@ class Octave:
         return Octave(self.value - other.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class Pitch:
     """
     音高は、C4の音に対し上方のオクターブ移動と完全五度移動がそれぞれ何回行われたかによって表現される。
@@ -92,8 +135,21 @@ class Pitch:
     octave: Octave
     note_name: NoteName
 
+    # 探索中の比較を軽くするため、等価性はフィールドのタプルを作らずに整数同士で比較する。
+    # of で共有されたオブジェクト同士であれば同一性の比較だけで済む。
+    # ハッシュ値は dataclass が生成するものと同じ値を返す
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if type(other) is not Pitch:
+            return NotImplemented
+        return self.octave.value == other.octave.value and self.note_name.value == other.note_name.value
+
+    def __hash__(self) -> int:
+        return hash((self.octave, self.note_name))
+
     def __add__(self, other: "Interval") -> "Pitch":
-        return Pitch(self.octave + Octave(other.octave), self.note_name + NoteName(other.fifth))
+        return Pitch.of(self.octave.value + other.octave, self.note_name.value + other.fifth)
 
     def __sub__(self, other: "Pitch") -> "Interval":
         return Interval(self.octave.value - other.octave.value, self.note_name.value - other.note_name.value)
@@ -116,24 +172,21 @@ class Pitch:
         F##4といった表記をパースしてPitchオブジェクトを作成する
 
         Pitch.parse(str(pitch)) == pitch が成り立つ。
+        同じ表記に対しては一度作成したオブジェクトを返す。
         """
-        pattern = r"^([A-G][#b]*)(\d+)$"
-        match = re.fullmatch(pattern, name)
-        if not match:
-            raise ValueError(f"Invalid pitch name format: {name}")
-
-        note_name_str, octave_str = match.groups()
+        cached = cls._PARSE_CACHE.get(name)
+        if cached is not None:
+            return cached
 
-        note_name = NoteName.parse(note_name_str)
-        octave = int(octave_str)
-
-        step, alter = note_name.internal_pitch_notation()
-
-        base_octave = cls._STEP_TO_BASE_OCTAVE[step]
-
-        pitch_octave_value = base_octave + alter * -4 + octave - 4
+        note_name_str, octave_str = _split_number_suffix(name)
+        step_alter = NoteName._parse_step_alter(note_name_str)
+        if step_alter is None or not octave_str:
+            raise ValueError(f"Invalid pitch name format: {name}")
 
-        return cls(Octave(pitch_octave_value), note_name)
+        step, alter = step_alter
+        pitch = cls.from_internal_pitch_notation(step, alter, int(octave_str))
+        cls._PARSE_CACHE[name] = pitch
+        return pitch
 
     def internal_pitch_notation(self) -> tuple[str, int, int]:
         """
@@ -151,7 +204,19 @@ class Pitch:
         note_name = NoteName.from_internal_pitch_notation(step, alter)
         base_octave = cls._STEP_TO_BASE_OCTAVE[step]
         pitch_octave_value = base_octave + alter * -4 + octave - 4
-        return cls(Octave(pitch_octave_value), note_name)
+        return cls.of(pitch_octave_value, note_name.value)
+
+    @classmethod
+    def of(cls, octave: int, note_name: int) -> "Pitch":
+        """
+        オクターブと音名の値から Pitch を得る。
+        探索中に同じ音高が大量に作られるため、同じ値の組みに対しては共有のオブジェクトを返す。
+        """
+        key = (octave, note_name)
+        pitch = cls._POOL.get(key)
+        if pitch is None:
+            pitch = cls._POOL[key] = cls(Octave(octave), NoteName.of(note_name))
+        return pitch
 
     def num(self) -> "PitchNumber":
         """
@@ -161,6 +226,10 @@ class Pitch:
 
     # --- private map for name/parse ---
     _STEP_TO_BASE_OCTAVE: ClassVar[dict[str, int]] = {"C": 0, "D": -1, "E": -2, "F": 1, "G": 0, "A": -1, "B": -2}
+    # parse の結果。テストや課題の定義で同じ表記が繰り返しパースされる
+    _PARSE_CACHE: ClassVar[dict[str, "Pitch"]] = {}
+    # of で共有する Pitch。 (オクターブの値, 音名の値) をキーとする
+    _POOL: ClassVar[dict[tuple[int, int], "Pitch"]] = {}
 
 
 ## ----- 調性に対する定義
@@ -185,7 +254,7 @@ class Mode(Enum):
                 return -3
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Key:
     """
     調。主音の音名と旋法の組み。
@@ -198,7 +267,7 @@ class Key:
 ## ----- 調性と音高から導けるもの
 
 
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, slots=True)
 class DegreeStep:
     """
     音度距離。調の音階上の位置を示す。
@@ -226,7 +295,7 @@ class DegreeStep:
         return cls(s)
 
 
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, slots=True)
 class DegreeAlter:
     """
     変化度。音階の固有の音度に対し増一度の変化が何回行われているか。
@@ -239,7 +308,7 @@ class DegreeAlter:
             raise ValueError("Step must be between -1 and 2.")
 
 
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, slots=True)
 class Degree:
     """
     音度。音度距離と変化度の組み。
@@ -252,32 +321,57 @@ class Degree:
     def from_note_name_key(cls, note_name: NoteName, key: Key) -> "Degree":
         # 調の主音から見た音高の音程(定位相対音名)を求める
         r = note_name.value - key.tonic.value
+        m = key.mode.offset()
+        # 結果は相対音名と旋法の値だけで決まるので、その組みで一度作成したものを返す
+        cached = cls._FROM_RELATIVE_CACHE.get((r, m))
+        if cached is not None:
+            return cached
+
+        step, alter = cls._step_alter_from_relative(r, m)
+        degree = Degree(DegreeStep(step), DegreeAlter(alter))
+        cls._FROM_RELATIVE_CACHE[(r, m)] = degree
+        return degree
+
+    @staticmethod
+    def _step_alter_from_relative(r: int, m: int) -> tuple[int, int]:
+        """
+        from_note_name_key の計算部分。
+        相対音名 r と旋法の値 m から、音度距離と変化度の値の組を整数のまま求める。
+        """
 
         # 1. 変化度 a の計算
         #
         # 定位相対音名 Rm: { -1 + m <= r_0 <= 5 + m } に対し、
         # r_0 = r - 7a を代入して a について解く。
-        m = key.mode.offset()
-        alter = DegreeAlter(round((r - m - 2) / 7))
+        alter = round((r - m - 2) / 7)
 
         # 2. 基準となる定位相対音名 r_0 の特定
         # 上記で求めた a を使って r から逆算する
-        r_0 = r - (7 * alter.value)
+        r_0 = r - (7 * alter)
 
         # 3. 音度距離 d の計算
-        step = DegreeStep((4 * r_0) % 7)
-        return Degree(step, alter)
+        step = (4 * r_0) % 7
+        return step, alter
 
     def note_name(self, key: Key) -> "NoteName":
         """
         この音度に調を与えて音名を得る
         """
+        r = self._relative_from_step_alter(self.step.value, self.alter.value, key.mode.offset())
 
-        m = key.mode.offset()
+        # 調の主音の音名と相対音名を足す
+        return NoteName.of(key.tonic.value + r)
+
+    @staticmethod
+    def _relative_from_step_alter(step: int, alter: int, m: int) -> int:
+        """
+        note_name の計算部分。
+        音度距離と変化度の値、旋法の値 m から、相対音名 r を整数のまま求める。
+        """
 
         # 1. r_0 を求める
         # 4r_0 ≡ d (mod 7) を解く。 4*2=8≡1 より r_0 ≡ 2d (mod 7)
-        r_0_candidate = (2 * self.step.value) % 7
+        r_0_candidate = (2 * step) % 7
 
         # 2. r_0 を定位相対音名の範囲に収める
         # -1+m <= r_0 <= 5+m
@@ -290,13 +384,10 @@ class Degree:
             r_0 = r_0_candidate + 7
         else:
             # このケースは発生しないはず
-            raise ValueError(f"Cannot find r_0 for step {self.step} in mode {key.mode}")
+            raise ValueError(f"Cannot find r_0 for step {step} in mode offset {m}")
 
         # 3. 相対音名 r を計算する
-        r = r_0 + 7 * self.alter.value
-
-        # 調の主音の音名と相対音名を足す
-        return NoteName(key.tonic.value + r)
+        return r_0 + 7 * alter
 
     @classmethod
     def idx_1(cls, step: int, alter: int) -> "Degree":
@@ -305,11 +396,14 @@ class Degree:
         """
         return cls(DegreeStep.idx_1(step), DegreeAlter(alter))
 
+    # from_note_name_key の結果。 (相対音名, 旋法の値) をキーとする。和音の判定のたびに同じ組みが求められる
+    _FROM_RELATIVE_CACHE: ClassVar[dict[tuple[int, int], "Degree"]] = {}
+
 
 ## ----- 音程に関する定義
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class Interval:
     """
     音程。2つのPitchの差。上方・下方やオクターブ、長短の区別がされる。
@@ -320,6 +414,15 @@ class Interval:
     octave: int
     fifth: int
 
+    # 等価性はフィールドのタプルを作らずに整数同士で比較する。ハッシュ値は dataclass が生成するものと同じ値を返す
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not Interval:
+            return NotImplemented
+        return self.octave == other.octave and self.fifth == other.fifth
+
+    def __hash__(self) -> int:
+        return hash((self.octave, self.fifth))
+
     def __add__(self, other: "Interval") -> "Interval":
         return Interval(self.octave + other.octave, self.fifth + other.fifth)
 
@@ -356,6 +459,10 @@ class Interval:
         s = step.value
         a = alter.value
 
+        cached = cls._FROM_STEP_ALTER_CACHE.get((s, a))
+        if cached is not None:
+            return cached
+
         # 1. f_class (f % 7) は s から決まる (f ≡ 2s (mod 7))
         f_class = (2 * s) % 7
         f = 0  # fifth の値
@@ -372,14 +479,13 @@ class Interval:
 
         if a == 0:  # Perfect (P)
             # P (a=0) は f = -1, 0, 1
-            f_map = {0: 0, 1: 1, 6: -1}
-            if f_class not in f_map:
+            if f_class not in cls._PERFECT_F_CLASS_TO_FIFTH:
                 raise ValueError(f"IntervalStep {s} cannot be Perfect (alter=0)")
-            f = f_map[f_class]
+            f = cls._PERFECT_F_CLASS_TO_FIFTH[f_class]
 
         elif a == 1:  # Major (M)
             # M (a=1) は s と f が同符号
-            if f_class not in [2, 3, 4, 5]:
+            if f_class not in cls._MAJOR_MINOR_F_CLASSES:
                 raise ValueError(f"IntervalStep {s} cannot be Major (alter=1)")
 
             if step_sgn == 1:  # 上方 (f > 0)
@@ -389,7 +495,7 @@ class Interval:
 
         elif a == -1:  # Minor (m)
             # m (a=-1) は s と f が異符号
-            if f_class not in [2, 3, 4, 5]:
+            if f_class not in cls._MAJOR_MINOR_F_CLASSES:
                 raise ValueError(f"IntervalStep {s} cannot be Minor (alter=-1)")
 
             if step_sgn == 1:  # 上方 (f < 0)
@@ -422,7 +528,9 @@ class Interval:
             )
 
         o = residual // 7
-        return cls(octave=o, fifth=f)
+        interval = cls(octave=o, fifth=f)
+        cls._FROM_STEP_ALTER_CACHE[(s, a)] = interval
+        return interval
 
     def name(self) -> str:
         """
@@ -440,6 +548,15 @@ class Interval:
 
         増1度下は存在せず、減1度上(d1)として扱うことに注意。
         """
+        name = self._NAME_CACHE.get((self.octave, self.fifth))
+        if name is None:
+            name = self._NAME_CACHE[(self.octave, self.fifth)] = self._compute_name()
+        return name
+
+    def _compute_name(self) -> str:
+        """
+        name の計算部分。
+        """
         step = self.step()
         sgn = "" if step.value >= 0 else "-"
         num = f"{abs(step.value) + 1}"
@@ -463,15 +580,19 @@ class Interval:
     def parse(cls, name: str) -> "Interval":
         """
         name()メソッドの逆変換。"P1", "-m3", "AA4" 等の文字列をパースしてIntervalを生成する
+        同じ表記に対しては一度作成したオブジェクトを返す。
         """
-        pattern = re.compile(r"^([-]?)([PMm]|A+|d+)(\d+)$")
-        match = pattern.match(name)
+        cached = cls._PARSE_CACHE.get(name)
+        if cached is not None:
+            return cached
 
-        if not match:
+        sgn_str = "-" if name.startswith("-") else ""
+        qual_str, num_str = _split_number_suffix(name[len(sgn_str) :])
+        # 音程の種類は P, M, m のいずれか1文字か、 A のみまたは d のみの1文字以上
+        is_valid_qual = qual_str in ("P", "M", "m") or set(qual_str) in ({"A"}, {"d"})
+        if not is_valid_qual or not num_str:
             raise ValueError(f"Invalid interval name format: '{name}'")
 
-        sgn_str, qual_str, num_str = match.groups()
-
         num = int(num_str)
         if num < 1:
             raise ValueError(f"Interval degree must be 1 or greater, got {num}")
@@ -502,7 +623,9 @@ class Interval:
 
         alter = IntervalAlter(alter_val)
 
-        return cls.from_step_alter(step, alter)
+        interval = cls.from_step_alter(step, alter)
+        cls._PARSE_CACHE[name] = interval
+        return interval
 
     def normalize(self) -> "Interval":
         """
@@ -547,8 +670,21 @@ class Interval:
         """
         return IntervalNumber(self.fifth * 7 + self.octave * 12)
 
-
-@dataclass(frozen=True, order=True)
+    # from_step_alter で、完全音程となる f_class と fifth の値の対応
+    _PERFECT_F_CLASS_TO_FIFTH: ClassVar[dict[int, int]] = {0: 0, 1: 1, 6: -1}
+    # from_step_alter で、長短の音程となる f_class
+    _MAJOR_MINOR_F_CLASSES: ClassVar[frozenset[int]] = frozenset({2, 3, 4, 5})
+    # from_step_alter の結果。 (IntervalStep の値, IntervalAlter の値) をキーとする。
+    # normalize や abs を経由して、禁則の判定のたびに同じ組みが求められる
+    _FROM_STEP_ALTER_CACHE: ClassVar[dict[tuple[int, int], "Interval"]] = {}
+    # parse の結果。テストや禁則の定義で同じ表記が繰り返しパースされる
+    _PARSE_CACHE: ClassVar[dict[str, "Interval"]] = {}
+    # name の結果。 (octave, fifth) をキーとする。
+    # 構築のたびに計算すると探索中に大量に作られる Interval の負担になるため、初回の呼び出し時に求める
+    _NAME_CACHE: ClassVar[dict[tuple[int, int], str]] = {}
+
+
+@dataclass(frozen=True, order=True, slots=True)
 class IntervalStep:
     """
     音程のうち、派生音を無視して五線譜上で何度移動されたを表すもの。一般に言われる「3度」など。上方・下方やオクターブの区別がされる。
@@ -594,7 +730,7 @@ class IntervalStep:
         return cls(7)
 
 
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class IntervalAlter:
     """
     音程の長短・完全などを表す。
@@ -627,10 +763,28 @@ IntervalAlter.MINOR = IntervalAlter(-1)
 IntervalAlter.AUGMENTED = IntervalAlter(2)
 IntervalAlter.DIMINISHED = IntervalAlter(-2)
 
+
+def _register_interval_names() -> None:
+    """
+    2オクターブまでの上方・下方の音程を、重増・重減まで Interval.parse の結果として登録しておく。
+    これらの表記の parse は文字列の解析をせず辞書を引くだけになる。
+    """
+    for step_value in range(-14, 15):
+        for alter_value in range(-3, 4):
+            try:
+                interval = Interval.from_step_alter(IntervalStep(step_value), IntervalAlter(alter_value))
+            except ValueError:
+                # 完全音程にならない度数の完全や、長短にならない度数の長短
+                continue
+            Interval._PARSE_CACHE[interval.name()] = interval
+
+
+_register_interval_names()
+
 ## ----- 半音単位の音高・音程の概念
 
 
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class PitchNumber:
     """
     Pitchを半音階上で数えたもの、中央ハ音を0として、そこから半音上がると+1される。
@@ -645,7 +799,7 @@ class PitchNumber:
         return IntervalNumber(self.value - other.value)
 
 
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class IntervalNumber:
     """
     Intervalを半音階上で数えたもの、ユニゾンを0として、そこから半音上がると+1される。
@@ -663,20 +817,39 @@ class IntervalNumber:
 ## ----- 音価の定義
 
 
-@dataclass(frozen=True, order=True)
+# Duration と Offset の内部表現で、四分音符1つに相当する tick 数
+TICKS_PER_QUARTER = 480
+
+
+def _quarters_to_ticks(numerator: int, denominator: int | None) -> int:
+    """
+    四分音符を1とする有理数 numerator/denominator を tick 数に変換する。
+    tick で割り切れない値を指定した場合は例外
+    """
+    ticks, remainder = divmod(numerator * TICKS_PER_QUARTER, 1 if denominator is None else denominator)
+    if remainder != 0:
+        raise ValueError(f"{numerator}/{denominator} cannot be represented in ticks.")
+    return ticks
+
+
+@dataclass(frozen=True, order=True, slots=True)
 class Duration:
     """
-    音価を、四分音符を1とする有理数で表現します。
-    例: 四分音符 = 1, 八分音符 = 1/2, 全音符 = 4
+    音価を、四分音符を TICKS_PER_QUARTER とする整数の tick で表現します。
+    例: 四分音符 = Duration.of(1), 八分音符 = Duration.of(1, 2), 全音符 = Duration.of(4)
     """
 
-    value: Fraction
+    ticks: int
 
     def __add__(self, other: "Duration") -> "Duration":
-        return Duration(self.value + other.value)
+        return Duration(self.ticks + other.ticks)
 
     def __sub__(self, other: "Duration") -> "Duration":
-        return Duration(self.value - other.value)
+        return Duration(self.ticks - other.ticks)
+
+    def to_fraction(self) -> Fraction:
+        """四分音符を1とする有理数で返す"""
+        return Fraction(self.ticks, TICKS_PER_QUARTER)
 
     @classmethod
     def of(
@@ -684,16 +857,22 @@ class Duration:
         numerator: int,
         denominator: int | None = None,
     ) -> "Duration":
-        if denominator is not None:
-            return cls(Fraction(numerator, denominator))
-        else:
-            return cls(Fraction(numerator))
+        cached = cls._OF_CACHE.get((numerator, denominator))
+        if cached is not None:
+            return cached
+
+        duration = cls(_quarters_to_ticks(numerator, denominator))
+        cls._OF_CACHE[(numerator, denominator)] = duration
+        return duration
+
+    # of の結果。同じ音価が繰り返し作られる
+    _OF_CACHE: ClassVar[dict[tuple[int, int | None], "Duration"]] = {}
 
 
 ## ----- 音符の定義
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Note:
     """
     単一の音符、または休符を表現します。
@@ -708,22 +887,26 @@ class Note:
 ## ----- 楽譜の定義
 
 
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class Offset:
     """
-    小節における音符の位置。0から始まる。Durationと同様に四分音符を1と数える
+    小節における音符の位置。0から始まる。Durationと同様に四分音符を TICKS_PER_QUARTER とする tick で数える
     """
 
-    value: Fraction
+    ticks: int
 
     def __add__(self, other: "Offset") -> "Offset":
-        return Offset(self.value + other.value)
+        return Offset(self.ticks + other.ticks)
 
     def __sub__(self, other: "Offset") -> "Offset":
-        return Offset(self.value - other.value)
+        return Offset(self.ticks - other.ticks)
 
     def add_duration(self, duration: Duration) -> "Offset":
-        return Offset(self.value + duration.value)
+        return Offset(self.ticks + duration.ticks)
+
+    def to_fraction(self) -> Fraction:
+        """四分音符を1とする有理数で返す"""
+        return Fraction(self.ticks, TICKS_PER_QUARTER)
 
     @classmethod
     def of(
@@ -731,10 +914,7 @@ class Offset:
         numerator: int,
         denominator: int | None = None,
     ) -> "Offset":
-        if denominator is not None:
-            return cls(Fraction(numerator, denominator))
-        else:
-            return cls(Fraction(numerator))
+        return cls(_quarters_to_ticks(numerator, denominator))
 
     @classmethod
     def idx_1(
@@ -742,13 +922,10 @@ class Offset:
         numerator: int,
         denominator: int | None = None,
     ) -> "Offset":
-        if denominator is not None:
-            return cls(Fraction(numerator - 1, denominator))
-        else:
-            return cls(Fraction(numerator - 1))
+        return cls(_quarters_to_ticks(numerator - 1, denominator))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Measure:
     """
     1小節分のデータを表現します。
@@ -757,17 +934,16 @@ class Measure:
     notes: list[Note]
 
     def total_duration(self) -> Duration:
-        durations = [note.duration for note in self.notes]
-        return sum(durations, Duration(Fraction(0)))
+        return Duration(sum(note.duration.ticks for note in self.notes))
 
     def at(self, offset: Offset) -> Pitch | None:
         """
         小節内のある音符の位置における音符または休符を返す
         範囲外の位置を指定された場合は例外となる
         """
-        current_offset = Offset(Fraction(0))
+        current_offset = Offset(0)
         for note in self.notes:
-            note_end_offset = Offset(current_offset.value + note.duration.value)
+            note_end_offset = current_offset.add_duration(note.duration)
             if current_offset <= offset < note_end_offset:
                 return note.pitch
         raise ValueError(f"offset {offset} not found in this measure: {self.notes}")
@@ -3,12 +3,47 @@
 import itertools
 import random
 from collections.abc import Iterable, Iterator
+from functools import cache
 from typing import TypeVar
 
-from my_project.model import Degree, DegreeStep, Interval, IntervalStep, Key, Mode, NoteName, Octave, PartId, Pitch
+from my_project.model import Degree, DegreeStep, Interval, IntervalStep, Key, Mode, NoteName, PartId, Pitch
 
 T = TypeVar("T")
 
+# scale_pitches で利用する、 C4 から始まる1オクターブ分の音階。 Pitch を作らずに (Octave, NoteName) の値の組で持つ
+# 長音階: C4 D4 E4 F4 G4 A4 B4
+_MAJOR_SCALE_TEMPLATE: tuple[tuple[int, int], ...] = (
+    (0, 0),
+    (-1, 2),
+    (-2, 4),
+    (1, -1),
+    (0, 1),
+    (-1, 3),
+    (-2, 5),
+)
+# 和声的短音階: C4 D4 Eb4 F4 G4 Ab4 B4
+_HARMONIC_MINOR_SCALE_TEMPLATE: tuple[tuple[int, int], ...] = (
+    (0, 0),
+    (-1, 2),
+    (2, -3),
+    (1, -1),
+    (0, 1),
+    (3, -4),
+    (-2, 5),
+)
+# 自然的・和声的・旋律的短音階の全ての音: C4 D4 Eb4 F4 G4 Ab4 A4 Bb4 B4
+_ALL_MINOR_SCALE_TEMPLATE: tuple[tuple[int, int], ...] = (
+    (0, 0),
+    (-1, 2),
+    (2, -3),
+    (1, -1),
+    (0, 1),
+    (3, -4),
+    (-1, 3),
+    (2, -2),
+    (-2, 5),
+)
+
 
 def part_range(part_id: PartId) -> tuple[Pitch, Pitch]:
     match part_id:
@@ -24,14 +59,14 @@ def part_range(part_id: PartId) -> tuple[Pitch, Pitch]:
 
 def is_in_part_range(pitch: Pitch, part_id: PartId) -> bool:
     min, max = part_range(part_id)
-    return min.num() <= pitch.num() <= max.num()
+    return min.num().value <= pitch.num().value <= max.num().value
 
 
 def sorted_pitches(list: list[Pitch]) -> list[Pitch]:
     """
     異名同音は無視して音高のリストを昇順に並べる
     """
-    return sorted(list, key=lambda p: p.num())
+    return sorted(list, key=lambda p: p.num().value)
 
 
 def scale_pitches(
@@ -44,75 +79,52 @@ def scale_pitches(
     短調の場合は和声的短音階を利用する。両端は含まれる。
     返り値のリストの音高は昇順となる。
     """
+    # 調と音域の組み合わせは限られるので、計算結果をキャッシュして呼び出し側には複製を返す
+    return list(_scale_pitches(key, range, include_all_minor_scale))
+
+
+@cache
+def _scale_pitches(key: Key, range: tuple[Pitch, Pitch], include_all_minor_scale: bool) -> tuple[Pitch, ...]:
+    """
+    scale_pitches の計算部分。
+    """
 
     min = range[0]
     max = range[1]
 
-    # 与えられた調の主音の音名からなるさまざまな音高のうち、 min 以下の最大の音高を求める
-    key_p = Pitch(
-        octave=Octave(((min.note_name.value - key.tonic.value) * 7 + min.octave.value * 12) // 12),
-        note_name=key.tonic,
-    )
+    # 与えられた調の主音の音名からなるさまざまな音高のうち、 min 以下の最大の音高のオクターブを求める
+    key_octave_value = ((min.note_name.value - key.tonic.value) * 7 + min.octave.value * 12) // 12
 
     # 求めた音名から始まる音階を1オクターブ分作成する
     match key.mode:
         case Mode.MAJOR:
-            scale = [
-                Pitch.parse("C4"),
-                Pitch.parse("D4"),
-                Pitch.parse("E4"),
-                Pitch.parse("F4"),
-                Pitch.parse("G4"),
-                Pitch.parse("A4"),
-                Pitch.parse("B4"),
-            ]
+            template = _MAJOR_SCALE_TEMPLATE
         case Mode.MINOR:
-            if include_all_minor_scale:
-                scale = [
-                    Pitch.parse("C4"),
-                    Pitch.parse("D4"),
-                    Pitch.parse("Eb4"),
-                    Pitch.parse("F4"),
-                    Pitch.parse("G4"),
-                    Pitch.parse("Ab4"),
-                    Pitch.parse("A4"),
-                    Pitch.parse("Bb4"),
-                    Pitch.parse("B4"),
-                ]
-            else:
-                scale = [
-                    Pitch.parse("C4"),
-                    Pitch.parse("D4"),
-                    Pitch.parse("Eb4"),
-                    Pitch.parse("F4"),
-                    Pitch.parse("G4"),
-                    Pitch.parse("Ab4"),
-                    Pitch.parse("B4"),
-                ]
+            template = _ALL_MINOR_SCALE_TEMPLATE if include_all_minor_scale else _HARMONIC_MINOR_SCALE_TEMPLATE
     scale = [
-        Pitch(
-            octave=Octave(key_p.octave.value + p.octave.value),
-            note_name=NoteName(key_p.note_name.value + p.note_name.value),
-        )
-        for p in scale
+        (key_octave_value + octave_value, key.tonic.value + note_name_value)
+        for octave_value, note_name_value in template
     ]
 
     # 音階をオクターブ移動しながら、 min <= p <= max の範囲の音階を作成する
+    # 範囲の判定は PitchNumber の値を整数のまま計算して行い、範囲内の音だけ Pitch を作成する
+    min_num = min.num().value
+    max_num = max.num().value
     result: list[Pitch] = []
     for o_value in itertools.count():
-        octave = Octave(o_value)
-        shift_scale = [Pitch(octave + p.octave, note_name=p.note_name) for p in scale]
-        for p in shift_scale:
-            if p.num() < min.num():
+        for scale_octave_value, note_name_value in scale:
+            octave_value = o_value + scale_octave_value
+            num = note_name_value * 7 + octave_value * 12
+            if num < min_num:
                 continue
-            if max.num() < p.num():
+            if max_num < num:
                 break
-            result.append(p)
+            result.append(Pitch.of(octave_value, note_name_value))
         else:
             continue
         break
 
-    return result
+    return tuple(result)
 
 
 def add_interval_step_in_key(key: Key, pitch: Pitch, interval_step: IntervalStep) -> Pitch:
@@ -136,9 +148,19 @@ def add_interval_step_in_key(key: Key, pitch: Pitch, interval_step: IntervalStep
     Returns:
         Pitch: 新しいピッチ。
     """
+    # 移動量はオクターブによらず、調・音名・音程のステップのみで決まるので表引きする
+    return pitch + _interval_step_in_key(key, pitch.note_name, interval_step)
 
-    # 1. 開始ピッチの音名と、キーにおける音度(Degree)を取得
-    start_note_name = pitch.note_name
+
+@cache
+def _interval_step_in_key(key: Key, start_note_name: NoteName, interval_step: IntervalStep) -> Interval:
+    """
+    add_interval_step_in_key のための表。開始音名から、キーの文脈で音程分だけ上方に移動する Interval を返す。
+
+    探索中に同じ組み合わせで何度も呼ばれるため、結果をキャッシュする。
+    """
+
+    # 1. 開始音名の、キーにおける音度(Degree)を取得
     start_degree = Degree.from_note_name_key(start_note_name, key)
 
     # 2. 目標の音度(Degree)を計算
@@ -178,11 +200,9 @@ def add_interval_step_in_key(key: Key, pitch: Pitch, interval_step: IntervalStep
 
     octave_diff = numerator // 7
 
-    # 5. 計算した Interval を元の Pitch に足して、新しい Pitch を得る
+    # 5. 計算した Interval を返す。呼び出し側で元の Pitch に足して新しい Pitch を得る
     #    Pitch.__add__ は Interval を受け取るように定義されている
-    interval_to_add = Interval(octave=octave_diff, fifth=fifth_diff)
-
-    return pitch + interval_to_add
+    return Interval(octave=octave_diff, fifth=fifth_diff)
 
 
 def shuffled_interleave(iterables: Iterable[Iterable[T]], randomized: bool = True) -> Iterator[T]:
@@ -243,6 +263,7 @@ def shuffled_interleave(iterables: Iterable[Iterable[T]], randomized: bool = Tru
 
 
 # 音列から隣り合わせの3つの音を作成
-def sliding(input_list: list[T], window_size: int) -> list[list[T]]:
+# バリデーションは禁則が見つかった時点で打ち切るので、窓は取り出されるたびに作成する
+def sliding(input_list: list[T], window_size: int) -> Iterator[list[T]]:
     n = len(input_list)
-    return [input_list[i : i + window_size] for i in range(n - window_size + 1)]
+    return (input_list[i : i + window_size] for i in range(n - window_size + 1))
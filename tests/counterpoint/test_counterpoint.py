@@ -1,41 +1,33 @@
-from my_project.counterpoint.counterpoint import SearchingPassingNoteInMeasureState
+from my_project.counterpoint.model import KEY
+from my_project.counterpoint.search_passing_tone import conjunct_pitches
 from my_project.model import (
     IntervalStep,
-    Key,
-    Mode,
-    NoteName,
     Pitch,
 )
 
-KEY = Key(tonic=NoteName.parse("C"), mode=Mode.MAJOR)
+G3 = Pitch.parse("G3")
+A3 = Pitch.parse("A3")
+B3 = Pitch.parse("B3")
+C4 = Pitch.parse("C4")
+D4 = Pitch.parse("D4")
+E4 = Pitch.parse("E4")
 
 
 def test_passing_note_conjunct_pitches() -> None:
-    assert SearchingPassingNoteInMeasureState.conjunct_pitches(
-        key=KEY, pitch=Pitch.parse("C4"), interval_step=IntervalStep.idx_1(3)
-    ) == [
-        Pitch.parse("D4"),
-        Pitch.parse("E4"),
+    assert conjunct_pitches(key=KEY, pitch=C4, interval_step=IntervalStep.idx_1(3)) == [
+        D4,
+        E4,
     ]
 
-    assert SearchingPassingNoteInMeasureState.conjunct_pitches(
-        key=KEY, pitch=Pitch.parse("C4"), interval_step=IntervalStep.idx_1(-3)
-    ) == [
-        Pitch.parse("B3"),
-        Pitch.parse("A3"),
+    assert conjunct_pitches(key=KEY, pitch=C4, interval_step=IntervalStep.idx_1(-3)) == [
+        B3,
+        A3,
     ]
 
-    assert SearchingPassingNoteInMeasureState.conjunct_pitches(
-        key=KEY, pitch=Pitch.parse("C4"), interval_step=IntervalStep.idx_1(-4)
-    ) == [
-        Pitch.parse("B3"),
-        Pitch.parse("A3"),
-        Pitch.parse("G3"),
+    assert conjunct_pitches(key=KEY, pitch=C4, interval_step=IntervalStep.idx_1(-4)) == [
+        B3,
+        A3,
+        G3,
     ]
 
-    assert (
-        SearchingPassingNoteInMeasureState.conjunct_pitches(
-            key=KEY, pitch=Pitch.parse("C4"), interval_step=IntervalStep.idx_1(1)
-        )
-        == []
-    )
+    assert conjunct_pitches(key=KEY, pitch=C4, interval_step=IntervalStep.idx_1(1)) == []
@@ -0,0 +1,83 @@
+from collections import Counter
+from fractions import Fraction
+
+import pytest
+
+from my_project.counterpoint.global_context import GlobalContext
+from my_project.counterpoint.global_state import GlobalState, generate, generate_parallel
+from my_project.counterpoint.model import REALIZE_PART_ID, RythmnType
+from my_project.model import Pitch, Score
+
+# 全ての解を列挙しても短時間で終わる課題
+CANTUS_FIRMUS = [Pitch.parse(name) for name in ["C3", "E3", "D3", "G3", "C3"]]
+RYTHMN_TYPE = RythmnType.HALF_NOTE
+
+
+def _realized_notes(score: Score) -> tuple[tuple[str, Fraction], ...]:
+    """
+    Score の実施声部の音符を、比較できる (音名, 音価) の列に変換する
+    """
+    part = next(part for part in score.parts if part.part_id == REALIZE_PART_ID)
+    return tuple(
+        (note.pitch.name() if note.pitch is not None else "None", note.duration.to_fraction())
+        for measure in part.measures
+        for note in measure.notes
+    )
+
+
+def _all_realized_notes() -> Counter[tuple[tuple[str, Fraction], ...]]:
+    start_state = GlobalState.start_state(CANTUS_FIRMUS, RYTHMN_TYPE)
+    return Counter(_realized_notes(end_state.to_score()) for end_state in start_state.final_states())
+
+
+def test_local_search_memo_keeps_all_solutions(monkeypatch: pytest.MonkeyPatch) -> None:
+    with_memo = _all_realized_notes()
+
+    # 探索のたびに異なるキーを返し、小節の探索結果が使い回されないようにする
+    monkeypatch.setattr(GlobalContext, "local_search_key", lambda self: object())
+    without_memo = _all_realized_notes()
+
+    assert with_memo
+    assert with_memo == without_memo
+
+
+def test_local_search_memo_records_only_finished_search() -> None:
+    start_state = GlobalState.start_state(CANTUS_FIRMUS, RYTHMN_TYPE)
+    memo = start_state.global_ctx.local_search_memo
+
+    # 途中で読むのをやめた小節の探索は、探索中も破棄された後も記録されない
+    next_states = start_state.next_states()
+    next(next_states)
+    assert memo == {}
+    del next_states
+    assert memo == {}
+
+    # 最後まで探索すると記録され、以降は記録した結果が使い回される
+    searched = list(start_state.next_states())
+    assert list(memo) == [start_state.global_ctx.local_search_key()]
+    assert len(memo[start_state.global_ctx.local_search_key()]) == len(searched)
+
+    reused = list(start_state.next_states())
+    assert Counter(state.global_ctx.completed_measures for state in reused) == Counter(
+        state.global_ctx.completed_measures for state in searched
+    )
+
+
+def test_generate_parallel() -> None:
+    all_solutions = Counter(_realized_notes(score) for score in generate(CANTUS_FIRMUS, RYTHMN_TYPE))
+    subtree_count = len(list(GlobalState.start_state(CANTUS_FIRMUS, RYTHMN_TYPE).next_states()))
+
+    # 各部分木から1つずつ返す場合は、 generate でも得られる解のいずれかが部分木の数まで返される
+    limited = [
+        _realized_notes(score)
+        for score in generate_parallel(CANTUS_FIRMUS, RYTHMN_TYPE, max_workers=2, limit_per_subtree=1)
+    ]
+    assert 0 < len(limited) <= subtree_count
+    assert len(set(limited)) == len(limited)
+    assert set(limited) <= set(all_solutions)
+
+    # 制限しない場合は generate と同じ解を全て返す
+    unlimited = Counter(
+        _realized_notes(score) for score in generate_parallel(CANTUS_FIRMUS, RYTHMN_TYPE, max_workers=2)
+    )
+    assert unlimited == all_solutions
@@ -2,25 +2,48 @@ from my_project.harmony import Chord, start_chord, triad_note_names
 from my_project.model import Key, Mode, NoteName, PartId, Pitch
 from my_project.util import part_range, scale_pitches
 
+F_SHARP_2 = Pitch.parse("F#2")
+G2 = Pitch.parse("G2")
+A2 = Pitch.parse("A2")
+B2 = Pitch.parse("B2")
+C_SHARP_3 = Pitch.parse("C#3")
+D3 = Pitch.parse("D3")
+E3 = Pitch.parse("E3")
+F_SHARP_3 = Pitch.parse("F#3")
+G3 = Pitch.parse("G3")
+A3 = Pitch.parse("A3")
+B3 = Pitch.parse("B3")
+C4 = Pitch.parse("C4")
+C_SHARP_4 = Pitch.parse("C#4")
+D4 = Pitch.parse("D4")
+F_SHARP_4 = Pitch.parse("F#4")
+G4 = Pitch.parse("G4")
+A4 = Pitch.parse("A4")
+B_FLAT_4 = Pitch.parse("Bb4")
+C5 = Pitch.parse("C5")
+D5 = Pitch.parse("D5")
+E_FLAT_5 = Pitch.parse("Eb5")
+E5 = Pitch.parse("E5")
+
 
 def test_scale_pitches() -> None:
     assert scale_pitches(
         key=Key(tonic=NoteName.parse("D"), mode=Mode.MAJOR),
         range=part_range(PartId.BASS),
     ) == [
-        Pitch.parse("F#2"),
-        Pitch.parse("G2"),
-        Pitch.parse("A2"),
-        Pitch.parse("B2"),
-        Pitch.parse("C#3"),
-        Pitch.parse("D3"),
-        Pitch.parse("E3"),
-        Pitch.parse("F#3"),
-        Pitch.parse("G3"),
-        Pitch.parse("A3"),
-        Pitch.parse("B3"),
-        Pitch.parse("C#4"),
-        Pitch.parse("D4"),
+        F_SHARP_2,
+        G2,
+        A2,
+        B2,
+        C_SHARP_3,
+        D3,
+        E3,
+        F_SHARP_3,
+        G3,
+        A3,
+        B3,
+        C_SHARP_4,
+        D4,
     ]
 
 
@@ -29,68 +52,64 @@ def test_triad_note_names() -> None:
     assert triad_note_names(
         bass=NoteName.parse("D"),
         key=Key(tonic=NoteName.parse("D"), mode=Mode.MAJOR),
-    ) == set(
-        [
-            NoteName.parse("D"),
-            NoteName.parse("F#"),
-            NoteName.parse("A"),
-        ]
-    )
+    ) == {
+        NoteName.parse("D"),
+        NoteName.parse("F#"),
+        NoteName.parse("A"),
+    }
 
     # ホ短調でバスがB (Vの和音)
     assert triad_note_names(
         bass=NoteName.parse("B"),
         key=Key(tonic=NoteName.parse("E"), mode=Mode.MINOR),
-    ) == set(
-        [
-            NoteName.parse("B"),
-            NoteName.parse("D#"),
-            NoteName.parse("F#"),
-        ]
-    )
+    ) == {
+        NoteName.parse("B"),
+        NoteName.parse("D#"),
+        NoteName.parse("F#"),
+    }
 
 
 def test_start_chord() -> None:
     chord = start_chord(
-        Pitch.parse("C4"),
+        C4,
         key=Key(tonic=NoteName.parse("C"), mode=Mode.MAJOR),
     )
     assert chord == Chord(
-        bass=Pitch.parse("C4"),
-        tenor=Pitch.parse("G4"),
-        alto=Pitch.parse("C5"),
-        soprano=Pitch.parse("E5"),
+        bass=C4,
+        tenor=G4,
+        alto=C5,
+        soprano=E5,
     )
 
     chord = start_chord(
-        Pitch.parse("C4"),
+        C4,
         key=Key(tonic=NoteName.parse("C"), mode=Mode.MINOR),
     )
     assert chord == Chord(
-        bass=Pitch.parse("C4"),
-        tenor=Pitch.parse("G4"),
-        alto=Pitch.parse("C5"),
-        soprano=Pitch.parse("Eb5"),
+        bass=C4,
+        tenor=G4,
+        alto=C5,
+        soprano=E_FLAT_5,
     )
 
     chord = start_chord(
-        Pitch.parse("D3"),
+        D3,
         key=Key(tonic=NoteName.parse("D"), mode=Mode.MAJOR),
     )
     assert chord == Chord(
-        bass=Pitch.parse("D3"),
-        tenor=Pitch.parse("F#4"),
-        alto=Pitch.parse("A4"),
-        soprano=Pitch.parse("D5"),
+        bass=D3,
+        tenor=F_SHARP_4,
+        alto=A4,
+        soprano=D5,
     )
 
     chord = start_chord(
-        Pitch.parse("G2"),
+        G2,
         key=Key(tonic=NoteName.parse("G"), mode=Mode.MINOR),
     )
     assert chord == Chord(
-        bass=Pitch.parse("G2"),
-        tenor=Pitch.parse("G3"),
-        alto=Pitch.parse("D4"),
-        soprano=Pitch.parse("Bb4"),
+        bass=G2,
+        tenor=G3,
+        alto=D4,
+        soprano=B_FLAT_4,
     )
@@ -1,3 +1,4 @@
+import logging
 from fractions import Fraction
 
 from my_project.lilypond_writer import score_to_lilypond
@@ -15,36 +16,49 @@ from my_project.model import (
     TimeSignature,
 )
 
+C3 = Pitch.parse("C3")
+F3 = Pitch.parse("F3")
+G3 = Pitch.parse("G3")
+D4 = Pitch.parse("D4")
+E4 = Pitch.parse("E4")
+F4 = Pitch.parse("F4")
+G4 = Pitch.parse("G4")
+A4 = Pitch.parse("A4")
+B4 = Pitch.parse("B4")
+C5 = Pitch.parse("C5")
+
+logger = logging.getLogger(__name__)
+
 
 def test_write() -> None:
     key = Key(tonic=NoteName.parse("C"), mode=Mode.MAJOR)
 
     sop_pitches = [
-        Pitch.parse("C5"),
-        Pitch.parse("C5"),
-        Pitch.parse("B4"),
-        Pitch.parse("C5"),
+        C5,
+        C5,
+        B4,
+        C5,
     ]
     alto_pitches = [
-        Pitch.parse("G4"),
-        Pitch.parse("A4"),
-        Pitch.parse("G4"),
-        Pitch.parse("G4"),
+        G4,
+        A4,
+        G4,
+        G4,
     ]
     tenor_pitches = [
-        Pitch.parse("E4"),
-        Pitch.parse("F4"),
-        Pitch.parse("D4"),
-        Pitch.parse("E4"),
+        E4,
+        F4,
+        D4,
+        E4,
     ]
     bass_pitches = [
-        Pitch.parse("C3"),
-        Pitch.parse("F3"),
-        Pitch.parse("G3"),
-        Pitch.parse("C3"),
+        C3,
+        F3,
+        G3,
+        C3,
     ]
 
-    duration = Duration(Fraction(2))
+    duration = Duration.of(2)
 
     sop_notes = [Note(p, duration) for p in sop_pitches]
     alto_notes = [Note(p, duration) for p in alto_pitches]
@@ -67,11 +81,11 @@ def test_write() -> None:
         ],
     )
 
-    print(score)
+    logger.debug("score: %s", score)
 
     str_result = score_to_lilypond(score)
 
-    print(str_result)
+    logger.debug("lilypond:\n%s", str_result)
 
     assert (
         str_result
@@ -1,4 +1,19 @@
-from my_project.model import Degree, Interval, IntervalAlter, IntervalStep, Key, Mode, NoteName, Pitch
+from fractions import Fraction
+
+import pytest
+
+from my_project.model import (
+    Degree,
+    Duration,
+    Interval,
+    IntervalAlter,
+    IntervalStep,
+    Key,
+    Mode,
+    NoteName,
+    Offset,
+    Pitch,
+)
 
 
 def test_pitch() -> None:
@@ -6,6 +21,17 @@ def test_pitch() -> None:
     name = pitch.name()
     assert name == "F#4"
 
+    # 同じ表記のパース結果は使い回される
+    assert Pitch.parse("F#4") is pitch
+    assert NoteName.parse("F#") is NoteName.parse("F#")
+    assert Pitch.parse("F#4").note_name is NoteName.parse("F#")
+    # 共有されていない同じ値の音高とも等しく、ハッシュ値も一致する
+    assert Pitch(pitch.octave, pitch.note_name) == pitch
+    assert hash(Pitch(pitch.octave, pitch.note_name)) == hash(pitch)
+    assert Pitch.parse("F#5") != pitch
+    # 音程の加算結果も同じ音高であれば共有される
+    assert Pitch.parse("C4") + Interval.parse("P5") is Pitch.parse("G4")
+
 
 def test_degree() -> None:
     # ニ長調
@@ -34,6 +60,8 @@ def test_degree() -> None:
         Degree.idx_1(step=7, alter=0),
         Degree.idx_1(step=1, alter=0),
     ]
+    # 同じ音名と調の組みに対しては同じオブジェクトが返る
+    assert degrees[0] is degrees[7]
 
     # ハ短調・和声的短音階
 
@@ -63,209 +91,89 @@ def test_degree() -> None:
     ]
 
 
-def test_interval() -> None:
-    i = Interval.of(base=Pitch.parse("C4"), target=Pitch.parse("E4"))
-    assert i == Interval(octave=-2, fifth=4)
-    assert i.step() == IntervalStep.idx_1(3)
-    assert i.alter() == IntervalAlter.MAJOR
+@pytest.mark.parametrize(
+    ("base", "target", "octave", "fifth", "step_idx_1", "alter"),
+    [
+        ("C4", "E4", -2, 4, 3, IntervalAlter.MAJOR),
+        ("D4", "F4", 2, -3, 3, IntervalAlter.MINOR),
+        ("C4", "C5", 1, 0, 8, IntervalAlter.PERFECT),
+        ("C4", "Bb2", 0, -2, -9, IntervalAlter.MAJOR),
+        ("C4", "C#4", -4, 7, 1, IntervalAlter.AUGMENTED),
+        # 増1度下はモデル上は減1度上として扱う
+        ("C4", "Cb4", 4, -7, 1, IntervalAlter.DIMINISHED),
+        ("C4", "Dbb4", 7, -12, 2, IntervalAlter.DIMINISHED),
+        ("C4", "B#3", -7, 12, -2, IntervalAlter.DIMINISHED),
+    ],
+)
+def test_interval(base: str, target: str, octave: int, fifth: int, step_idx_1: int, alter: IntervalAlter) -> None:
+    i = Interval.of(base=Pitch.parse(base), target=Pitch.parse(target))
+    assert i == Interval(octave=octave, fifth=fifth)
+    assert i.step() == IntervalStep.idx_1(step_idx_1)
+    assert i.alter() == alter
     assert i == Interval.from_step_alter(i.step(), i.alter())
 
-    i = Interval.of(base=Pitch.parse("D4"), target=Pitch.parse("F4"))
-    assert i == Interval(octave=2, fifth=-3)
-    assert i.step() == IntervalStep.idx_1(3)
-    assert i.alter() == IntervalAlter.MINOR
-    assert i == Interval.from_step_alter(i.step(), i.alter())
-
-    i = Interval.of(base=Pitch.parse("C4"), target=Pitch.parse("C5"))
-    assert i == Interval(octave=1, fifth=0)
-    assert i.step() == IntervalStep.idx_1(8)
-    assert i.alter() == IntervalAlter.PERFECT
-    assert i == Interval.from_step_alter(i.step(), i.alter())
-
-    i = Interval.of(base=Pitch.parse("C4"), target=Pitch.parse("Bb2"))
-    assert i == Interval(octave=0, fifth=-2)
-    assert i.step() == IntervalStep.idx_1(-9)
-    assert i.alter() == IntervalAlter.MAJOR
-    assert i == Interval.from_step_alter(i.step(), i.alter())
-
-    i = Interval.of(base=Pitch.parse("C4"), target=Pitch.parse("C#4"))
-    assert i == Interval(octave=-4, fifth=7)
-    assert i.step() == IntervalStep.idx_1(1)
-    assert i.alter() == IntervalAlter.AUGMENTED
-    assert i == Interval.from_step_alter(i.step(), i.alter())
-
-    # 増1度下はモデル上は減1度上として扱う
-    i = Interval.of(base=Pitch.parse("C4"), target=Pitch.parse("Cb4"))
-    assert i == Interval(octave=4, fifth=-7)
-    assert i.step() == IntervalStep.idx_1(1)
-    assert i.alter() == IntervalAlter.DIMINISHED
-    assert i == Interval.from_step_alter(i.step(), i.alter())
-
-    i = Interval.of(base=Pitch.parse("C4"), target=Pitch.parse("Dbb4"))
-    assert i == Interval(octave=7, fifth=-12)
-    assert i.step() == IntervalStep.idx_1(2)
-    assert i.alter() == IntervalAlter.DIMINISHED
-    assert i == Interval.from_step_alter(i.step(), i.alter())
-
-    i = Interval.of(base=Pitch.parse("C4"), target=Pitch.parse("B#3"))
-    assert i == Interval(octave=-7, fifth=12)
-    assert i.step() == IntervalStep.idx_1(-2)
-    assert i.alter() == IntervalAlter.DIMINISHED
-    assert i == Interval.from_step_alter(i.step(), i.alter())
-
-
-def test_name_parse() -> None:
-    # --- 完全音程 (Perfect) ---
-    name = "P1"
-    i = Interval.parse(name)
-    assert i.name() == name
-    assert i == Interval.of(base=Pitch.parse("C4"), target=Pitch.parse("C4"))
-
-    name = "P5"
-    i = Interval.parse(name)
-    assert i.name() == name
-    assert i == Interval.of(base=Pitch.parse("C4"), target=Pitch.parse("G4"))
-
-    name = "P4"
-    i = Interval.parse(name)
-    assert i.name() == name
-    assert i == Interval.of(base=Pitch.parse("C4"), target=Pitch.parse("F4"))
-
-    name = "P8"
-    i = Interval.parse(name)
-    assert i.name() == name
-    assert i == Interval.of(base=Pitch.parse("C4"), target=Pitch.parse("C5"))
-
-    # --- 長音程 (Major) ---
-    name = "M2"
-    i = Interval.parse(name)
-    assert i.name() == name
-    assert i == Interval.of(base=Pitch.parse("C4"), target=Pitch.parse("D4"))
-
-    name = "M3"
-    i = Interval.parse(name)
-    assert i.name() == name
-    assert i == Interval.of(base=Pitch.parse("C4"), target=Pitch.parse("E4"))
-
-    name = "M6"
-    i = Interval.parse(name)
-    assert i.name() == name
-    assert i == Interval.of(base=Pitch.parse("C4"), target=Pitch.parse("A4"))
-
-    name = "M7"
-    i = Interval.parse(name)
-    assert i.name() == name
-    assert i == Interval.of(base=Pitch.parse("C4"), target=Pitch.parse("B4"))
 
-    # --- 短音程 (Minor) ---
-    name = "m2"
-    i = Interval.parse(name)
-    assert i.name() == name
-    assert i == Interval.of(base=Pitch.parse("C4"), target=Pitch.parse("Db4"))
-
-    name = "m3"
-    i = Interval.parse(name)
-    assert i.name() == name
-    assert i == Interval.of(base=Pitch.parse("C4"), target=Pitch.parse("Eb4"))
-
-    name = "m6"
-    i = Interval.parse(name)
-    assert i.name() == name
-    assert i == Interval.of(base=Pitch.parse("C4"), target=Pitch.parse("Ab4"))
-
-    name = "m7"
-    i = Interval.parse(name)
-    assert i.name() == name
-    assert i == Interval.of(base=Pitch.parse("C4"), target=Pitch.parse("Bb4"))
-
-    # --- 増音程 (Augmented) ---
-    name = "A4"
-    i = Interval.parse(name)
-    assert i.name() == name
-    assert i == Interval.of(base=Pitch.parse("C4"), target=Pitch.parse("F#4"))
-
-    name = "A1"
-    i = Interval.parse(name)
-    assert i.name() == name
-    assert i == Interval.of(base=Pitch.parse("C4"), target=Pitch.parse("C#4"))
-
-    # --- 減音程 (Diminished) ---
-    name = "d5"
-    i = Interval.parse(name)
-    assert i.name() == name
-    assert i == Interval.of(base=Pitch.parse("C4"), target=Pitch.parse("Gb4"))
-
-    name = "d7"
-    i = Interval.parse(name)
-    assert i.name() == name
-    # Bbb4 (Bのダブルフラット)
-    assert i == Interval.of(base=Pitch.parse("C4"), target=Pitch.parse("Bbb4"))
-
-    # --- 重増・重減 (Double) ---
-    name = "AA4"
-    i = Interval.parse(name)
-    assert i.name() == name
-    # F##4 (Fのダブルシャープ)
-    assert i == Interval.of(base=Pitch.parse("C4"), target=Pitch.parse("F##4"))
-
-    name = "dd5"
-    i = Interval.parse(name)
-    assert i.name() == name
-    # Gbb4 (Gのダブルフラット)
-    assert i == Interval.of(base=Pitch.parse("C4"), target=Pitch.parse("Gbb4"))
-
-    # --- 複合音程 (Compound) ---
-    name = "M9"  # (M2 + P8)
-    i = Interval.parse(name)
-    assert i.name() == name
-    assert i == Interval.of(base=Pitch.parse("C4"), target=Pitch.parse("D5"))
-
-    name = "P11"  # (P4 + P8)
-    i = Interval.parse(name)
-    assert i.name() == name
-    assert i == Interval.of(base=Pitch.parse("C4"), target=Pitch.parse("F5"))
-
-    name = "m10"  # (m3 + P8)
-    i = Interval.parse(name)
-    assert i.name() == name
-    assert i == Interval.of(base=Pitch.parse("C4"), target=Pitch.parse("Eb5"))
-
-    # --- 下方音程 (Downward) ---
-    name = "-P1"
-    i = Interval.parse(name)
-    assert i.name() == "P1"  # マイナスの部分は消える
-    assert i == Interval.of(base=Pitch.parse("C4"), target=Pitch.parse("C4"))
-
-    name = "-P5"
-    i = Interval.parse(name)
-    assert i.name() == name
-    assert i == Interval.of(base=Pitch.parse("C4"), target=Pitch.parse("F3"))
-
-    name = "-m3"
-    i = Interval.parse(name)
-    assert i.name() == name
+@pytest.mark.parametrize(
+    ("name", "expected_name", "target"),
+    [
+        # --- 完全音程 (Perfect) ---
+        ("P1", "P1", "C4"),
+        ("P5", "P5", "G4"),
+        ("P4", "P4", "F4"),
+        ("P8", "P8", "C5"),
+        # --- 長音程 (Major) ---
+        ("M2", "M2", "D4"),
+        ("M3", "M3", "E4"),
+        ("M6", "M6", "A4"),
+        ("M7", "M7", "B4"),
+        # --- 短音程 (Minor) ---
+        ("m2", "m2", "Db4"),
+        ("m3", "m3", "Eb4"),
+        ("m6", "m6", "Ab4"),
+        ("m7", "m7", "Bb4"),
+        # --- 増音程 (Augmented) ---
+        ("A4", "A4", "F#4"),
+        ("A1", "A1", "C#4"),
+        # --- 減音程 (Diminished) ---
+        ("d5", "d5", "Gb4"),
+        ("d7", "d7", "Bbb4"),  # Bbb4 (Bのダブルフラット)
+        # --- 重増・重減 (Double) ---
+        ("AA4", "AA4", "F##4"),  # F##4 (Fのダブルシャープ)
+        ("dd5", "dd5", "Gbb4"),  # Gbb4 (Gのダブルフラット)
+        # --- 複合音程 (Compound) ---
+        ("M9", "M9", "D5"),  # (M2 + P8)
+        ("P11", "P11", "F5"),  # (P4 + P8)
+        ("m10", "m10", "Eb5"),  # (m3 + P8)
+        # --- 下方音程 (Downward) ---
+        ("-P1", "P1", "C4"),  # マイナスの部分は消える
+        ("-P5", "-P5", "F3"),
+        ("-m3", "-m3", "A3"),
+        ("-M7", "-M7", "Db3"),
+        ("-M9", "-M9", "Bb2"),  # (M2 + P8) の下方
+        # --- 増1度下について ---
+        ("d1", "d1", "Cb4"),  # 「増1度下」はモデル上「減1度上」として扱う。
+    ],
+)
+def test_name_parse(name: str, expected_name: str, target: str) -> None:
+    i = Interval.parse(name)
+    assert i.name() == expected_name
+    assert i == Interval.of(base=Pitch.parse("C4"), target=Pitch.parse(target))
+
+
+def test_name_parse_step_alter() -> None:
+    i = Interval.parse("-m3")
     assert i.step() == IntervalStep.idx_1(-3)
     assert i.alter() == IntervalAlter.MINOR
-    assert i == Interval.of(base=Pitch.parse("C4"), target=Pitch.parse("A3"))
-
-    name = "-M7"
-    i = Interval.parse(name)
-    assert i.name() == name
-    assert i == Interval.of(base=Pitch.parse("C4"), target=Pitch.parse("Db3"))
-
-    name = "-M9"  # (M2 + P8) の下方
-    i = Interval.parse(name)
-    assert i.name() == name
-    assert i == Interval.of(base=Pitch.parse("C4"), target=Pitch.parse("Bb2"))
 
-    # --- 増1度下について ---
-
-    name = "d1"  # 「増1度下」はモデル上「減1度上」として扱う。
-    i = Interval.parse(name)
-    assert i.name() == name
+    # 「増1度下」はモデル上「減1度上」として扱う。
+    i = Interval.parse("d1")
     assert i.step() == IntervalStep.idx_1(1)
     assert i.alter() == IntervalAlter.DIMINISHED
-    assert i == Interval.of(base=Pitch.parse("C4"), target=Pitch.parse("Cb4"))
+
+    # 同じ表記に対しては同じオブジェクトを返す
+    assert Interval.parse("P5") is Interval.parse("P5")
+    assert Interval(1, 3).name() is Interval(1, 3).name()
+    assert len({Interval(1, 3), Interval(1, 3)}) == 1
 
 
 def test_interval_normalize() -> None:
@@ -284,3 +192,50 @@ def test_interval_normalize() -> None:
     i = Interval.of(base=Pitch.parse("C4"), target=Pitch.parse("E3"))  # 短6度下
     a = Interval.of(base=Pitch.parse("C4"), target=Pitch.parse("Ab4"))  # 短6度上
     assert i.normalize() == a
+
+
+@pytest.mark.parametrize(
+    ("numerator", "denominator"),
+    [
+        (4, None),  # 全音符
+        (2, None),  # 二分音符
+        (1, None),  # 四分音符
+        (1, 2),  # 八分音符
+        (1, 4),  # 十六分音符
+        (1, 8),  # 三十二分音符
+        (1, 16),  # 六十四分音符
+        (1, 3),  # 三連符の八分音符
+        (6, None),  # 付点全音符
+        (3, None),  # 付点二分音符
+        (3, 2),  # 付点四分音符
+        (3, 4),  # 付点八分音符
+        (7, 2),  # 複付点二分音符
+        (7, 4),  # 複付点四分音符
+        (7, 8),  # 複付点八分音符
+    ],
+)
+def test_duration_of(numerator: int, denominator: int | None) -> None:
+    duration = Duration.of(numerator, denominator)
+    assert duration.to_fraction() == Fraction(numerator, 1 if denominator is None else denominator)
+    assert Duration.of(numerator, denominator) is duration
+
+
+@pytest.mark.parametrize(("numerator", "denominator"), [(1, 7), (1, 64), (3, 256)])
+def test_duration_of_out_of_ticks(numerator: int, denominator: int) -> None:
+    # tick で割り切れない音価は表現できない
+    with pytest.raises(ValueError):
+        Duration.of(numerator, denominator)
+    with pytest.raises(ValueError):
+        Offset.of(numerator, denominator)
+
+
+def test_offset() -> None:
+    assert Offset.idx_1(1) == Offset.of(0)
+    assert Offset.idx_1(3) == Offset.of(2)
+    assert Offset.idx_1(4).to_fraction() == Fraction(3)
+    assert Offset.idx_1(2, 2).to_fraction() == Fraction(1, 2)
+
+    assert Offset.of(1, 2).add_duration(Duration.of(3, 2)) == Offset.of(2)
+    assert Offset.of(3) - Offset.of(1, 2) == Offset.of(5, 2)
+    assert Duration.of(1, 2) + Duration.of(1, 4) == Duration.of(3, 4)
+    assert Offset.of(1, 3) < Offset.of(1, 2)
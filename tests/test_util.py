@@ -1,5 +1,27 @@
-from my_project.model import Key, Mode, NoteName, PartId, Pitch
-from my_project.util import part_range, scale_pitches
+import logging
+
+from my_project.model import IntervalStep, Key, Mode, NoteName, PartId, Pitch
+from my_project.util import add_interval_step_in_key, part_range, scale_pitches
+
+C3 = Pitch.parse("C3")
+D3 = Pitch.parse("D3")
+E3 = Pitch.parse("E3")
+F3 = Pitch.parse("F3")
+G3 = Pitch.parse("G3")
+A3 = Pitch.parse("A3")
+B3 = Pitch.parse("B3")
+C4 = Pitch.parse("C4")
+D4 = Pitch.parse("D4")
+D_SHARP_4 = Pitch.parse("D#4")
+E4 = Pitch.parse("E4")
+F4 = Pitch.parse("F4")
+F_SHARP_4 = Pitch.parse("F#4")
+G4 = Pitch.parse("G4")
+A4 = Pitch.parse("A4")
+D5 = Pitch.parse("D5")
+F5 = Pitch.parse("F5")
+
+logger = logging.getLogger(__name__)
 
 
 def test_scale_pitches() -> None:
@@ -8,20 +30,30 @@ def test_scale_pitches() -> None:
         part_range(PartId.TENOR),
         include_all_minor_scale=True,
     )
-    for p in ps:
-        print(p.name())
+    logger.debug("scale_pitches: %s", [p.name() for p in ps])
     assert ps == [
-        Pitch.parse("C3"),
-        Pitch.parse("D3"),
-        Pitch.parse("E3"),
-        Pitch.parse("F3"),
-        Pitch.parse("G3"),
-        Pitch.parse("A3"),
-        Pitch.parse("B3"),
-        Pitch.parse("C4"),
-        Pitch.parse("D4"),
-        Pitch.parse("E4"),
-        Pitch.parse("F4"),
-        Pitch.parse("G4"),
-        Pitch.parse("A4"),
+        C3,
+        D3,
+        E3,
+        F3,
+        G3,
+        A3,
+        B3,
+        C4,
+        D4,
+        E4,
+        F4,
+        G4,
+        A4,
     ]
+
+
+def test_add_interval_step_in_key() -> None:
+    key = Key(tonic=NoteName.parse("C"), mode=Mode.MAJOR)
+
+    assert add_interval_step_in_key(key, D4, IntervalStep.idx_1(3)) == F4
+    assert add_interval_step_in_key(key, D5, IntervalStep.idx_1(3)) == F5
+    assert add_interval_step_in_key(key, C4, IntervalStep.idx_1(-2)) == B3
+    assert add_interval_step_in_key(key, B3, IntervalStep.idx_1(2)) == C4
+    # 変化音はその変化が保持される
+    assert add_interval_step_in_key(key, D_SHARP_4, IntervalStep.idx_1(3)) == F_SHARP_4